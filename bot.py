@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from datetime import datetime, timezone
@@ -11,6 +12,11 @@ from discord import app_commands
 from discord.ext import commands
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # optional; the default asyncio loop is used without it
+    uvloop = None
+
 from utils import Database, EmbedFactory, ReminderScheduler
 from utils.preference_manager import PreferenceManager
 from utils.notifications import NotificationRouter, EventNotifier
@@ -29,6 +35,15 @@ def _maybe_int(value: Optional[str]) -> Optional[int]:
         return None
 
 
+def _maybe_float(value: Optional[str]) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
 def load_config() -> Dict[str, Any]:
     load_dotenv()
     token = os.getenv("TOKEN") or os.getenv("token")
@@ -65,6 +80,33 @@ def load_config() -> Dict[str, Any]:
         ),
         "community_feature_webhook": os.getenv("COMMUNITY_FEATURE_WEBHOOK")
         or os.getenv("community_feature_webhook"),
+        # Optional connection pool overrides; unset values keep Database defaults
+        "db_pool": {
+            "pool_min_size": _maybe_int(
+                os.getenv("DB_POOL_MIN_SIZE") or os.getenv("db_pool_min_size")
+            ),
+            "pool_max_size": _maybe_int(
+                os.getenv("DB_POOL_MAX_SIZE") or os.getenv("db_pool_max_size")
+            ),
+            "max_queries": _maybe_int(
+                os.getenv("DB_POOL_MAX_QUERIES") or os.getenv("db_pool_max_queries")
+            ),
+            "max_inactive_connection_lifetime": _maybe_float(
+                os.getenv("DB_POOL_MAX_IDLE") or os.getenv("db_pool_max_idle")
+            ),
+            "command_timeout": _maybe_float(
+                os.getenv("DB_COMMAND_TIMEOUT") or os.getenv("db_command_timeout")
+            ),
+            "statement_cache_size": _maybe_int(
+                os.getenv("DB_STATEMENT_CACHE_SIZE")
+                or os.getenv("db_statement_cache_size")
+            ),
+            "max_cached_statement_lifetime": _maybe_float(
+                os.getenv("DB_STATEMENT_LIFETIME") or os.getenv("db_statement_lifetime")
+            ),
+            "synchronous_commit": os.getenv("DB_SYNCHRONOUS_COMMIT")
+            or os.getenv("db_synchronous_commit"),
+        },
     }
     return config
 
@@ -89,8 +131,13 @@ class DisTaskBot(commands.Bot):
         super().__init__(command_prefix="/", intents=intents)
         self.config = config
         self.logger = logging.getLogger("distask.bot")
+        pool_options = {
+            key: value for key, value in config["db_pool"].items() if value is not None
+        }
         self.db = Database(
-            config["database_url"], default_reminder=config["reminder_time"]
+            config["database_url"],
+            default_reminder=config["reminder_time"],
+            **pool_options,
         )
         self.embeds = EmbedFactory()
         self.start_time = datetime.now(
@@ -222,6 +269,9 @@ class DisTaskBot(commands.Bot):
 def main() -> None:
     config = load_config()
     setup_logging(config["log_file"])
+    if uvloop is not None:
+        # bot.run() creates its loop through asyncio.run, which honours the policy.
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     bot = DisTaskBot(config)
     bot.run(config["token"])
 
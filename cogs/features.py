@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import logging
 from typing import List, Optional
 
@@ -391,8 +390,6 @@ class FeaturesCog(commands.Cog):
         # Check analysis_data for similar candidates (from automation, already global)
         analysis_data = feature.get("analysis_data")
         if analysis_data:
-            if isinstance(analysis_data, str):
-                analysis_data = json.loads(analysis_data)
             similar_ids = analysis_data.get("similar_candidates", [])
             for similar_id in similar_ids:
                 similar_feature = await self.db.get_feature_request(similar_id)
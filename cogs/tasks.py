@@ -481,9 +481,9 @@ class TasksCog(commands.Cog):
         return task
 
     def _format_task_line(self, task) -> str:
-        from utils.embeds import _format_assignees
+        from utils.embeds import _format_assignees, _format_time
 
         assignee = _format_assignees(task).replace("👤 ", "").replace("👥 ", "")
         status = "✅" if task.get("completed") else "❌"
-        due = task.get("due_date") or "—"
+        due = _format_time(task.get("due_date"))
         return f"#{task['id']} [{status}] {task['title']} · Due: {due} · Assignee: {assignee}"
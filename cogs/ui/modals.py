@@ -471,6 +471,8 @@ class EditTaskModal(discord.ui.Modal):
         db: "Database",
         embeds: "EmbedFactory",
     ) -> None:
+        from utils.validators import ISO_FORMAT
+
         super().__init__(title=f"Edit Task #{task_id}", timeout=300)
         self.task_id = task_id
         self.task = task
@@ -524,7 +526,7 @@ class EditTaskModal(discord.ui.Modal):
         self.due_date_input = discord.ui.TextInput(
             label="Due Date (optional)",
             placeholder="Today, Tomorrow, 3 Days, 6 Days, 7 Days, or YYYY-MM-DD HH:MM UTC (empty to clear)",
-            default=task.get("due_date") or "",
+            default=task["due_date"].strftime(ISO_FORMAT) if task.get("due_date") else "",
             required=False,
             style=discord.TextStyle.short,
             max_length=50,
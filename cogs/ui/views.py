@@ -3002,8 +3002,8 @@ class BoardViewSetupView(discord.ui.View):
             self.pinned = False
         
         # Fetch board data
-        columns = await self.db.fetch_columns(self.board_id)
-        tasks = await self.db.fetch_tasks(self.board_id)
+        overview = await self.db.fetch_board_overview(self.board_id)
+        columns, tasks = overview["columns"], overview["tasks"]
         
         # Group tasks by column
         tasks_by_column: Dict[int, List[Dict[str, Any]]] = {}
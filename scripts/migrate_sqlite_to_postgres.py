@@ -15,7 +15,7 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from utils.db import Database
+from utils.db import Database, to_datetime
 
 
 def _load_sqlite_rows(sqlite_path: Path) -> Dict[str, List[Dict[str, object]]]:
@@ -122,9 +122,9 @@ async def _migrate(sqlite_path: Path, dsn: str, force: bool) -> Tuple[int, int,
                         row["title"],
                         row["description"],
                         row["assignee_id"],
-                        row["due_date"],
+                        to_datetime(row["due_date"]) if row["due_date"] else None,
                         row["created_by"],
-                        row["created_at"],
+                        to_datetime(row["created_at"]),
                         bool(row["completed"]),
                     )
                     for row in data["tasks"]
@@ -149,6 +149,17 @@ async def _migrate(sqlite_path: Path, dsn: str, force: bool) -> Tuple[int, int,
                     )
                     max_task_id = max(row[0] for row in task_rows)
                     await conn.execute("SELECT setval('tasks_id_seq', $1, true)", max_task_id)
+                    # init() already recorded the assignee backfill against the empty
+                    # database, so the migrated tasks need their task_assignees rows here.
+                    await conn.execute(
+                        """
+                        INSERT INTO task_assignees (task_id, user_id, assigned_at)
+                        SELECT id, assignee_id, created_at
+                        FROM tasks
+                        WHERE assignee_id IS NOT NULL
+                        ON CONFLICT (task_id, user_id) DO NOTHING
+                        """
+                    )
 
         return (
             len(guild_rows),
@@ -2,7 +2,20 @@
 
 import pytest
 import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import utils.db as db_module
 from utils import Database
+from utils.db import (
+    ISO_FORMAT,
+    _LRUCache,
+    _json_dumps,
+    _json_loads,
+    _parse_command_tag,
+    _utcnow,
+    to_datetime,
+)
 
 
 @pytest.mark.asyncio
@@ -65,3 +78,387 @@ async def test_board_creation(test_db_url, sample_guild_id, sample_user_id):
     finally:
         await db.close()
 
+
+async def _create_board_with_task(db, guild_id, user_id, **task_fields):
+    """Create a board plus one task in its first column; returns (board_id, column_id, task_id)."""
+    await db.ensure_guild(guild_id)
+    board_id = await db.create_board(
+        guild_id=guild_id,
+        channel_id=111111111111111111,
+        name=f"Test Board {datetime.now(timezone.utc).timestamp()}",
+        description=None,
+        created_by=user_id,
+    )
+    columns = await db.fetch_columns(board_id)
+    column_id = columns[0]["id"]
+    task_id = await db.create_task(
+        board_id=board_id,
+        column_id=column_id,
+        title=task_fields.pop("title", "Test Task"),
+        description=task_fields.pop("description", None),
+        assignee_id=task_fields.pop("assignee_id", None),
+        due_date=task_fields.pop("due_date", None),
+        created_by=user_id,
+        **task_fields,
+    )
+    return board_id, column_id, task_id
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_task_assignee_and_update_statements(test_db_url, sample_guild_id, sample_user_id):
+    """The assignee CTEs keep task_assignees and the legacy assignee_id in step."""
+    db = Database(test_db_url)
+    try:
+        await db.init()
+        _, _, task_id = await _create_board_with_task(
+            db, sample_guild_id, sample_user_id, assignee_ids=[1, 2]
+        )
+
+        await db.add_task_assignees(task_id, [3])
+        await db.remove_task_assignees(task_id, [1])
+        task = await db.fetch_task(task_id)
+        assert sorted(task["assignee_ids"]) == [2, 3]
+        assert task["assignee_id"] in (2, 3)
+
+        await db.set_task_assignees(task_id, [3, 4])
+        task = await db.fetch_task(task_id)
+        assert sorted(task["assignee_ids"]) == [3, 4]
+        assert task["assignee_id"] == 3
+
+        # ISO strings still bind to the TIMESTAMPTZ column; no-op edits report the task exists
+        assert await db.update_task(task_id, due_date="2030-01-02T03:04:05Z")
+        assert await db.update_task(task_id, due_date="2030-01-02T03:04:05Z")
+        task = await db.fetch_task(task_id)
+        assert task["due_date"] == datetime(2030, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        assert not await db.update_task(-1, title="missing")
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_remove_column_refuses_columns_with_live_tasks(test_db_url, sample_guild_id, sample_user_id):
+    db = Database(test_db_url)
+    try:
+        await db.init()
+        board_id, _, _ = await _create_board_with_task(db, sample_guild_id, sample_user_id)
+        column_id = await db.add_column(board_id, "Blocked")
+        task_id = await db.create_task(
+            board_id, column_id, "Blocker", None, None, None, sample_user_id
+        )
+
+        assert not await db.remove_column(board_id, "Blocked")
+        await db.delete_task(task_id)
+        assert await db.remove_column(board_id, "Blocked")
+        assert await db.get_column_by_name(board_id, "Blocked") is None
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_board_overview_and_detailed_stats(test_db_url, sample_guild_id, sample_user_id):
+    db = Database(test_db_url)
+    try:
+        await db.init()
+        overdue = datetime.now(timezone.utc) - timedelta(days=1)
+        board_id, column_id, task_id = await _create_board_with_task(
+            db, sample_guild_id, sample_user_id, due_date=overdue
+        )
+
+        overview = await db.fetch_board_overview(board_id)
+        assert [task["id"] for task in overview["tasks"]] == [task_id]
+        assert len(overview["columns"]) >= 3
+        assert await db.board_stats(board_id) == {"total": 1, "completed": 0, "overdue": 1}
+
+        stats = await db.board_stats_detailed(board_id)
+        assert stats["active"] == 1 and stats["overdue"] == 1
+        counts = {column["id"]: column["task_count"] for column in stats["column_breakdown"]}
+        assert counts[column_id] == 1
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_fetch_due_tasks_returns_native_datetimes(test_db_url, sample_guild_id, sample_user_id):
+    """TIMESTAMPTZ values come back as aware datetimes with microseconds intact."""
+    db = Database(test_db_url)
+    try:
+        await db.init()
+        due = datetime.now(timezone.utc).replace(microsecond=123456) - timedelta(hours=1)
+        _, _, task_id = await _create_board_with_task(
+            db, sample_guild_id, sample_user_id, due_date=due, assignee_ids=[5]
+        )
+
+        tasks = await db.fetch_due_tasks(datetime.now(timezone.utc))
+        task = next(task for task in tasks if task["id"] == task_id)
+        assert task["due_date"] == due
+        assert task["assignee_ids"] == [5]
+        assert isinstance(task["created_at"], datetime)
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_feature_votes_and_history_writes(test_db_url, sample_guild_id, sample_user_id):
+    """The unnest vote UPDATE, the duplicate UPDATE and the history append."""
+    db = Database(test_db_url)
+    try:
+        await db.init()
+        parent_id = await db.create_feature_request(
+            user_id=sample_user_id, guild_id=sample_guild_id, title="Parent",
+            suggestion="Parent suggestion", suggested_priority=None,
+        )
+        child_id = await db.create_feature_request(
+            user_id=sample_user_id, guild_id=sample_guild_id, title="Child",
+            suggestion="Child suggestion", suggested_priority=None,
+        )
+
+        await db.adjust_feature_votes(parent_id, up_delta=1)
+        await db.adjust_feature_votes(parent_id, up_delta=1, down_delta=-1)
+        await db.adjust_feature_votes(child_id, duplicate_delta=1)
+        await db.flush_feature_votes()
+        parent = await db.get_feature_request(parent_id)
+        assert (parent["community_upvotes"], parent["community_downvotes"]) == (2, 0)
+        assert (await db.get_feature_request(child_id))["community_duplicate_votes"] == 1
+
+        await db.mark_feature_duplicate(child_id, parent_id=parent_id, confidence=0.9)
+        child = await db.get_feature_request(child_id)
+        assert child["status"] == "duplicate" and child["duplicate_of"] == parent_id
+        assert child["analysis_data"]["duplicate_parent"] == parent_id
+        assert child["merge_history"][-1]["action"] == "marked_duplicate"
+        parent = await db.get_feature_request(parent_id)
+        assert parent["status"] != "duplicate"
+        assert parent["merge_history"][-1]["child_id"] == child_id
+
+        await db.append_feature_history(parent_id, {"step": 1})
+        assert (await db.get_feature_request(parent_id))["merge_history"][-1] == {"step": 1}
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_concurrent_notification_claims_insert_once(test_db_url, sample_guild_id, sample_user_id):
+    db = Database(test_db_url)
+    try:
+        await db.init()
+        _, _, task_id = await _create_board_with_task(db, sample_guild_id, sample_user_id)
+
+        claims = await asyncio.gather(
+            *(
+                db.record_notification_if_not_sent(sample_user_id, sample_guild_id, task_id, "due_date")
+                for _ in range(5)
+            )
+        )
+        claimed = [claim for claim in claims if claim is not None]
+        assert len(claimed) == 1
+
+        assert await db.delete_notification(claimed[0])
+        assert await db.record_notification_if_not_sent(
+            sample_user_id, sample_guild_id, task_id, "due_date"
+        ) is not None
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_init_converts_text_timestamps_to_timestamptz(test_db_url):
+    """The DO block in init() migrates a legacy TEXT tasks table in place."""
+    schema = "distask_timestamptz_migration_test"
+    admin = Database(test_db_url)
+    await admin.init()
+    try:
+        await admin._execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+        await admin._execute(f"CREATE SCHEMA {schema}")
+        await admin._execute(
+            f"""
+            CREATE TABLE {schema}.tasks (
+                id BIGSERIAL PRIMARY KEY,
+                board_id BIGINT NOT NULL,
+                column_id BIGINT NOT NULL,
+                title TEXT NOT NULL,
+                description TEXT,
+                assignee_id BIGINT,
+                due_date TEXT,
+                created_by BIGINT,
+                created_at TEXT NOT NULL,
+                completed BOOLEAN NOT NULL DEFAULT FALSE
+            )
+            """
+        )
+        await admin._execute(
+            f"""
+            INSERT INTO {schema}.tasks (board_id, column_id, title, due_date, created_at)
+            VALUES (1, 1, 'legacy', '2024-03-01T09:30:00Z', '2024-03-01T09:30:00'),
+                   (1, 1, 'undated', NULL, '2024-03-02T10:00:00+02:00'),
+                   (1, 1, 'date only', '2024-03-01', '')
+            """
+        )
+
+        legacy = Database(test_db_url, server_settings={"search_path": f"{schema}, public"})
+        try:
+            await legacy.init()
+            rows = await legacy._execute(
+                "SELECT title, due_date, created_at FROM tasks ORDER BY id", fetchall=True
+            )
+            types = await legacy._execute(
+                """
+                SELECT column_name, data_type FROM information_schema.columns
+                WHERE table_schema = $1 AND table_name = 'tasks'
+                  AND column_name IN ('due_date', 'created_at')
+                """,
+                (schema,),
+                fetchall=True,
+            )
+        finally:
+            await legacy.close()
+
+        assert {row["data_type"] for row in types} == {"timestamp with time zone"}
+        expected = datetime(2024, 3, 1, 9, 30, tzinfo=timezone.utc)
+        assert rows[0]["due_date"] == expected and rows[0]["created_at"] == expected
+        assert rows[1]["due_date"] is None
+        assert rows[1]["created_at"] == datetime(2024, 3, 2, 8, 0, tzinfo=timezone.utc)
+        # A bare date is midnight UTC, not an offset; a blank NOT NULL value gets the migration time
+        assert rows[2]["due_date"] == datetime(2024, 3, 1, tzinfo=timezone.utc)
+        assert rows[2]["created_at"] is not None
+    finally:
+        await admin._execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+        await admin.close()
+
+
+def test_utcnow_matches_iso_format():
+    """_utcnow() output round-trips through ISO_FORMAT as a UTC timestamp."""
+    value = _utcnow()
+    parsed = datetime.strptime(value, ISO_FORMAT).replace(tzinfo=timezone.utc)
+    assert value.endswith("Z")
+    assert abs((datetime.now(timezone.utc) - parsed).total_seconds()) < 5
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """The lookup cache drops the entry that was touched longest ago."""
+    cache = _LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    cache.pop("a")
+    assert cache.get("a") is None and len(cache) == 1
+
+
+def test_lru_cache_expires_entries_after_ttl(monkeypatch):
+    """Entries stored with a TTL read as misses once it has elapsed."""
+    now = [100.0]
+    monkeypatch.setattr(db_module.time, "monotonic", lambda: now[0])
+    cache = _LRUCache(4, ttl=30.0)
+    cache.set("a", 1)
+    now[0] += 29.0
+    assert cache.get("a") == 1
+    now[0] += 2.0
+    assert cache.get("a") is None and len(cache) == 0
+
+
+def test_parse_command_tag_reads_row_count():
+    """Row counts come from the last word of the command tag."""
+    assert _parse_command_tag("UPDATE 3") == 3
+    assert _parse_command_tag("INSERT 0 5") == 5
+    assert _parse_command_tag("CREATE TABLE") == 0
+    assert _parse_command_tag("") == 0
+
+
+def test_to_datetime_normalises_timestamptz_binds():
+    """ISO strings and naive datetimes become aware UTC datetimes, keeping microseconds."""
+    expected = datetime(2024, 3, 1, 9, 30, tzinfo=timezone.utc)
+    assert to_datetime("2024-03-01T09:30:00Z") == expected
+    assert to_datetime("2024-03-01T09:30:00") == expected  # naive means UTC
+    assert to_datetime(datetime(2024, 3, 1, 9, 30)) == expected
+    offset = datetime(2024, 3, 1, 11, 30, tzinfo=timezone(timedelta(hours=2)))
+    assert to_datetime(offset) is offset
+    assert to_datetime("2024-03-01T09:30:00.123456Z").microsecond == 123456
+
+
+def test_json_codec_round_trips_payloads():
+    """The JSON codec (orjson when installed) stringifies int keys like json.dumps."""
+    payload = {"similar_candidates": [3, 5], 7: "seven", "note": "caf\u00e9"}
+    encoded = _json_dumps(payload)
+    assert isinstance(encoded, str)
+    assert json.loads(encoded) == {"similar_candidates": [3, 5], "7": "seven", "note": "caf\u00e9"}
+    assert _json_loads(encoded) == json.loads(encoded)
+
+
+@pytest.mark.asyncio
+async def test_adjust_feature_votes_coalesces_a_burst(monkeypatch):
+    """Votes queued within the flush window reach the database as one UPDATE."""
+    monkeypatch.setattr(db_module, "VOTE_FLUSH_DELAY", 0)
+    db = Database("postgresql://unused")
+    calls = []
+
+    async def fake_execute(query, params=(), **kwargs):
+        calls.append(params)
+
+    monkeypatch.setattr(db, "_execute", fake_execute)
+
+    await db.adjust_feature_votes(1, up_delta=1)
+    await db.adjust_feature_votes(2, down_delta=1)
+    await db.adjust_feature_votes(1, up_delta=1, duplicate_delta=1)
+    await db._vote_flush
+
+    assert calls == [([1, 2], [2, 0], [0, 1], [1, 0])]
+    assert db._pending_votes == {}
+
+
+@pytest.mark.asyncio
+async def test_vote_flush_retries_after_a_failed_write(monkeypatch):
+    """A failed vote write is logged and retried instead of waiting for the next vote."""
+    monkeypatch.setattr(db_module, "VOTE_FLUSH_DELAY", 0)
+    monkeypatch.setattr(db_module, "VOTE_FLUSH_RETRY_DELAY", 0)
+    db = Database("postgresql://unused")
+    calls = []
+
+    async def flaky_execute(query, params=(), **kwargs):
+        calls.append(params)
+        if len(calls) == 1:
+            raise ConnectionError("database went away")
+
+    monkeypatch.setattr(db, "_execute", flaky_execute)
+
+    await db.adjust_feature_votes(7, up_delta=1)
+    await db._vote_flush
+
+    assert calls == [([7], [1], [0], [0])] * 2
+    assert db._pending_votes == {} and db._vote_flush is None
+
+
+@pytest.mark.asyncio
+async def test_close_writes_votes_from_a_cancelled_flush(monkeypatch):
+    """Cancelling a flush mid-write re-queues its deltas so close() still writes them."""
+    monkeypatch.setattr(db_module, "VOTE_FLUSH_DELAY", 0)
+    db = Database("postgresql://unused")
+    started = asyncio.Event()
+    written = []
+
+    async def slow_execute(query, params=(), **kwargs):
+        if not started.is_set():
+            started.set()
+            await asyncio.Event().wait()
+        written.append(params)
+
+    class FakePool:
+        async def close(self):
+            pass
+
+    monkeypatch.setattr(db, "_execute", slow_execute)
+    db._pool = FakePool()
+
+    await db.adjust_feature_votes(3, down_delta=1)
+    await started.wait()
+    await db.close()
+
+    assert written == [([3], [0], [1], [0])]
+    assert db._pending_votes == {} and db._pool is None
@@ -74,8 +74,8 @@ class BoardViewUpdater:
             return
         
         # Fetch board data
-        columns = await self.db.fetch_columns(board_id)
-        tasks = await self.db.fetch_tasks(board_id)
+        overview = await self.db.fetch_board_overview(board_id)
+        columns, tasks = overview["columns"], overview["tasks"]
         
         # Group tasks by column
         tasks_by_column: Dict[int, List[Dict]] = {}
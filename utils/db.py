@@ -1,36 +1,226 @@
 from __future__ import annotations
 
+import asyncio
 import json
-from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 import asyncpg
 
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json codec is used without it
+    orjson = None
+
 ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+DEFAULT_COLUMNS = ("To Do", "In Progress", "Done")
+# Task columns returned by list-style reads. Detail reads (fetch_task) still
+# select everything, including completion_notes.
+TASK_LIST_COLUMNS = (
+    "id",
+    "board_id",
+    "column_id",
+    "title",
+    "description",
+    "assignee_id",
+    "due_date",
+    "created_by",
+    "created_at",
+    "completed",
+)
+_TASK_COLUMNS = frozenset(TASK_LIST_COLUMNS + ("completion_notes", "deleted_at"))
+_TASK_LIST_PROJECTION = ", ".join(f"t.{name}" for name in TASK_LIST_COLUMNS)
+# Reaction votes arrive in bursts; adjust_feature_votes collects deltas for this
+# many seconds and writes them all in one UPDATE.
+VOTE_FLUSH_DELAY = 0.1
+# A failed vote flush is retried after this many seconds, doubling up to the cap.
+VOTE_FLUSH_RETRY_DELAY = 1.0
+VOTE_FLUSH_MAX_RETRY_DELAY = 60.0
+
+# Per-session settings applied to every pooled connection. JIT compilation costs
+# more than it saves on these small OLTP statements, and application_name makes
+# the bot's sessions easy to find in pg_stat_activity.
+DEFAULT_SERVER_SETTINGS: Dict[str, str] = {
+    "lock_timeout": "5s",
+    "jit": "off",
+    "application_name": "distask",
+}
+
+# Client-side limit for the schema bootstrap in init(). Column rewrites and index
+# builds on a large database run far past command_timeout; asyncpg treats
+# timeout=None as "use command_timeout", so this has to be an explicit value.
+SCHEMA_BOOTSTRAP_TIMEOUT = 3600.0
+
+logger = logging.getLogger(__name__)
 
 
 def _utcnow() -> str:
-    return datetime.now(timezone.utc).strftime(ISO_FORMAT)
+    # time.gmtime skips building an aware datetime; ~2x faster on the write path.
+    return time.strftime(ISO_FORMAT, time.gmtime())
+
+
+def to_datetime(value: Union[datetime, str]) -> datetime:
+    """Return an aware datetime for an ISO-8601 string or datetime; naive values are UTC.
+
+    TIMESTAMPTZ columns (tasks.due_date/created_at, task_assignees.assigned_at,
+    notification_history.sent_at, snoozed_reminders.snooze_until) read back as
+    aware datetimes with full microsecond precision and bind only from datetimes,
+    so ISO strings such as Validator.parse_due_date's go through here first.
+    """
+    if isinstance(value, str):
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+if orjson is not None:
+
+    def _json_dumps(value: Any) -> str:
+        # OPT_NON_STR_KEYS matches json.dumps, which stringifies int dict keys.
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _json_loads = orjson.loads
+else:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+
+async def init_connection(conn: asyncpg.Connection) -> None:
+    """Register the json/jsonb codecs on a new connection."""
+    for typename in ("json", "jsonb"):
+        await conn.set_type_codec(
+            typename, encoder=_json_dumps, decoder=_json_loads, schema="pg_catalog"
+        )
+
+
+def _log_task_failure(task: asyncio.Task) -> None:
+    """Done-callback for background tasks, so their errors are logged instead of dropped."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background database task failed", exc_info=task.exception())
 
 
 def _parse_command_tag(tag: str) -> int:
-    try:
-        return int(tag.rsplit(" ", 1)[1])
-    except (IndexError, ValueError):
-        return 0
+    # Row count is the last word of e.g. "UPDATE 3" or "INSERT 0 5"; tags without one count as 0.
+    count = tag.rpartition(" ")[2]
+    return int(count) if count.isdigit() else 0
+
+
+class _LRUCache:
+    """Small bounded mapping that evicts the least recently used entry.
+
+    With ``ttl`` set, entries also expire that many seconds after being stored.
+    """
+
+    def __init__(self, maxsize: int, *, ttl: Optional[float] = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[Any, float]]" = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        try:
+            value, expires_at = self._data[key]
+        except KeyError:
+            return None
+        if expires_at and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
 
 
 class Database:
     """Async wrapper around PostgreSQL with helper methods for DisTask."""
 
-    def __init__(self, dsn: str, *, default_reminder: str = "09:00") -> None:
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        default_reminder: str = "09:00",
+        server_settings: Optional[Dict[str, str]] = None,
+        statement_cache_size: int = 1024,
+        pool_min_size: int = 4,
+        pool_max_size: int = 32,
+        max_queries: int = 50000,
+        max_inactive_connection_lifetime: float = 300.0,
+        max_cached_statement_lifetime: float = 300.0,
+        command_timeout: Optional[float] = 30.0,
+        synchronous_commit: Optional[str] = None,
+    ) -> None:
         self.dsn = dsn
         self.default_reminder = default_reminder
+        self.server_settings = {**DEFAULT_SERVER_SETTINGS, **(server_settings or {})}
+        # Opt-in only: "off" lets the server acknowledge a COMMIT before its WAL is
+        # flushed, so a server crash can lose the last acknowledged writes.
+        if synchronous_commit is not None:
+            self.server_settings["synchronous_commit"] = synchronous_commit
+        # asyncpg keeps an LRU of prepared statements per connection keyed by SQL
+        # text; this module issues well over the default 100 distinct statements.
+        # Behind PgBouncer in transaction pooling mode, pass statement_cache_size=0.
+        self.statement_cache_size = statement_cache_size
+        # Re-prepare cached statements periodically so a plan built against old
+        # statistics does not live for the whole lifetime of the connection.
+        self.max_cached_statement_lifetime = max_cached_statement_lifetime
+        # Keep a few warm connections for reminder bursts; recycle backends after
+        # max_queries so per-connection caches on the server cannot grow unbounded.
+        self.pool_min_size = pool_min_size
+        self.pool_max_size = pool_max_size
+        self.max_queries = max_queries
+        self.max_inactive_connection_lifetime = max_inactive_connection_lifetime
+        self.command_timeout = command_timeout
+        # UPDATE text per update_task field set, so repeat calls reuse one SQL string.
+        self._update_task_sql: Dict[Tuple[str, ...], str] = {}
+        # Same idea for _upsert_settings, keyed by table and the columns being written.
+        self._upsert_sql: Dict[Tuple[str, Tuple[str, ...], Tuple[str, ...]], str] = {}
+        # Read-mostly lookups hit on nearly every command; setters below invalidate.
+        self._guild_cache = _LRUCache(1000)
+        # Columns and feature requests can also be written by other processes
+        # (web dashboard, feature agent), so their entries expire after a short TTL.
+        self._column_cache = _LRUCache(4096, ttl=30.0)
+        self._feature_cache = _LRUCache(2048, ttl=15.0)
+        # [up, down, duplicate] deltas per feature id awaiting flush_feature_votes.
+        self._pending_votes: Dict[int, List[int]] = {}
+        self._vote_flush: Optional[asyncio.Task] = None
+        # Guild rows are never deleted, so once seen ensure_guild can skip the upsert.
+        self._known_guilds: Set[int] = set()
         self._pool: Optional[asyncpg.Pool] = None
 
     async def init(self) -> None:
         if self._pool is None:
-            self._pool = await asyncpg.create_pool(dsn=self.dsn, min_size=1, max_size=10, timeout=10.0)
+            self._pool = await asyncpg.create_pool(
+                dsn=self.dsn,
+                min_size=self.pool_min_size,
+                max_size=self.pool_max_size,
+                max_queries=self.max_queries,
+                max_inactive_connection_lifetime=self.max_inactive_connection_lifetime,
+                timeout=10.0,
+                command_timeout=self.command_timeout,
+                statement_cache_size=self.statement_cache_size,
+                max_cached_statement_lifetime=self.max_cached_statement_lifetime,
+                # Headroom over asyncpg's 15 KiB default so long CTE statements stay cached.
+                max_cacheable_statement_size=32 * 1024,
+                server_settings=self.server_settings,
+                init=init_connection,
+            )
         async with self._pool.acquire() as conn:
             schema_statements = [
                 """
@@ -69,9 +259,9 @@ class Database:
                     title TEXT NOT NULL,
                     description TEXT,
                     assignee_id BIGINT,
-                    due_date TEXT,
+                    due_date TIMESTAMPTZ,
                     created_by BIGINT,
-                    created_at TEXT NOT NULL,
+                    created_at TIMESTAMPTZ NOT NULL,
                     completed BOOLEAN NOT NULL DEFAULT FALSE,
                     completion_notes TEXT,
                     deleted_at TEXT
@@ -81,14 +271,12 @@ class Database:
                 CREATE TABLE IF NOT EXISTS task_assignees (
                     task_id BIGINT NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
                     user_id BIGINT NOT NULL,
-                    assigned_at TEXT NOT NULL,
+                    assigned_at TIMESTAMPTZ NOT NULL,
                     PRIMARY KEY (task_id, user_id)
                 )
                 """,
                 "CREATE INDEX IF NOT EXISTS idx_task_assignees_task ON task_assignees(task_id)",
                 "CREATE INDEX IF NOT EXISTS idx_task_assignees_user ON task_assignees(user_id)",
-                "CREATE INDEX IF NOT EXISTS idx_tasks_board ON tasks(board_id)",
-                "CREATE INDEX IF NOT EXISTS idx_tasks_due ON tasks(due_date)",
                 """
                 CREATE TABLE IF NOT EXISTS feature_requests (
                     id SERIAL PRIMARY KEY,
@@ -115,6 +303,7 @@ class Database:
                 )
                 """,
                 "CREATE INDEX IF NOT EXISTS idx_feature_requests_guild ON feature_requests(guild_id)",
+                "DROP INDEX IF EXISTS idx_feature_requests_created",
                 "ALTER TABLE feature_requests ADD COLUMN IF NOT EXISTS duplicate_of INTEGER REFERENCES feature_requests(id)",
                 "ALTER TABLE feature_requests ADD COLUMN IF NOT EXISTS merge_history JSONB NOT NULL DEFAULT '[]'::jsonb",
                 "ALTER TABLE feature_requests ADD COLUMN IF NOT EXISTS analysis_data JSONB NOT NULL DEFAULT '{}'::jsonb",
@@ -127,6 +316,31 @@ class Database:
                 "ALTER TABLE feature_requests ADD COLUMN IF NOT EXISTS community_duplicate_votes INTEGER NOT NULL DEFAULT 0",
                 "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS completion_notes TEXT",
                 "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS deleted_at TEXT",
+                # Task indexes, kept to what the queries need since every task write maintains them:
+                # fetch_due_tasks (reminders, scheduler) scans open, dated, live tasks across boards.
+                "CREATE INDEX IF NOT EXISTS idx_tasks_due_open ON tasks(due_date) WHERE completed = FALSE AND due_date IS NOT NULL AND deleted_at IS NULL",
+                # Everything scoped to a board: fetch_tasks (with or without column_id),
+                # fetch_tasks_for_boards, board_stats/board_stats_detailed and remove_column.
+                "CREATE INDEX IF NOT EXISTS idx_tasks_board_col ON tasks(board_id, column_id)",
+                "DROP INDEX IF EXISTS idx_tasks_due",
+                "DROP INDEX IF EXISTS idx_tasks_board",
+                "DROP INDEX IF EXISTS idx_tasks_due_active",
+                "DROP INDEX IF EXISTS idx_tasks_board_assignee",
+                "DROP INDEX IF EXISTS idx_tasks_board_completed",
+                # Trigram indexes make search_tasks' ILIKE '%query%' predicates indexable.
+                # pg_trgm is a trusted extension, but skip quietly where it can't be installed.
+                """
+                DO $$
+                BEGIN
+                    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+                    CREATE INDEX IF NOT EXISTS idx_tasks_title_trgm ON tasks USING GIN (title gin_trgm_ops);
+                    CREATE INDEX IF NOT EXISTS idx_tasks_description_trgm
+                        ON tasks USING GIN ((COALESCE(description, '')) gin_trgm_ops);
+                EXCEPTION WHEN insufficient_privilege OR undefined_file THEN
+                    RAISE NOTICE 'pg_trgm unavailable, task search will scan';
+                END
+                $$
+                """,
                 # FR-10: Completion permission gating
                 "ALTER TABLE guilds ADD COLUMN IF NOT EXISTS completion_assignee_only BOOLEAN NOT NULL DEFAULT FALSE",
                 "ALTER TABLE guilds ADD COLUMN IF NOT EXISTS completion_allowed_roles BIGINT[] NOT NULL DEFAULT '{}'",
@@ -144,6 +358,8 @@ class Database:
                 # Create partial unique indexes that only apply to non-deleted rows
                 "CREATE UNIQUE INDEX IF NOT EXISTS boards_guild_id_name_unique ON boards(guild_id, name) WHERE deleted_at IS NULL",
                 "CREATE UNIQUE INDEX IF NOT EXISTS columns_board_id_name_unique ON columns(board_id, name) WHERE deleted_at IS NULL",
+                # Case-insensitive lookups in get_column_by_name
+                "CREATE INDEX IF NOT EXISTS idx_columns_board_lower_name ON columns(board_id, LOWER(name)) WHERE deleted_at IS NULL",
                 # FR-6: Always-visible boards
                 """
                 CREATE TABLE IF NOT EXISTS board_views (
@@ -156,12 +372,26 @@ class Database:
                 """,
                 "CREATE INDEX IF NOT EXISTS idx_board_views_board ON board_views(board_id)",
                 "CREATE INDEX IF NOT EXISTS idx_board_views_channel ON board_views(channel_id)",
-                # Migrate existing assignee_id values to task_assignees table (one-time migration)
+                # Names of one-time data migrations that have already run
                 """
+                CREATE TABLE IF NOT EXISTS schema_migrations (
+                    name TEXT PRIMARY KEY,
+                    applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+                )
+                """,
+                # Migrate existing assignee_id values to task_assignees table (one-time migration).
+                # Once recorded, the gate is a one-time filter and tasks is not scanned again.
+                """
+                WITH gate AS (
+                    INSERT INTO schema_migrations (name) VALUES ('task_assignees_backfill')
+                    ON CONFLICT (name) DO NOTHING
+                    RETURNING name
+                )
                 INSERT INTO task_assignees (task_id, user_id, assigned_at)
                 SELECT id, assignee_id, created_at
                 FROM tasks
-                WHERE assignee_id IS NOT NULL
+                WHERE EXISTS (SELECT 1 FROM gate)
+                  AND assignee_id IS NOT NULL
                   AND NOT EXISTS (
                       SELECT 1 FROM task_assignees ta WHERE ta.task_id = tasks.id AND ta.user_id = tasks.assignee_id
                   )
@@ -230,16 +460,31 @@ class Database:
                     guild_id BIGINT REFERENCES guilds(guild_id) ON DELETE CASCADE,
                     task_id BIGINT REFERENCES tasks(id) ON DELETE CASCADE,
                     notification_type TEXT NOT NULL,
-                    sent_at TEXT NOT NULL,
+                    sent_at TIMESTAMPTZ NOT NULL,
                     acknowledged_at TEXT,
                     delivery_method TEXT,
                     notification_data JSONB DEFAULT '{}'::jsonb
                 )
                 """,
-                "CREATE INDEX IF NOT EXISTS idx_notification_history_user ON notification_history(user_id)",
+                # Dedup probe in check_notification_sent and record_notification_if_not_sent; its user_id prefix replaces idx_notification_history_user
+                "CREATE INDEX IF NOT EXISTS idx_notification_history_dedup ON notification_history(user_id, task_id, notification_type, sent_at DESC)",
+                "DROP INDEX IF EXISTS idx_notification_history_user",
                 "CREATE INDEX IF NOT EXISTS idx_notification_history_task ON notification_history(task_id)",
                 "CREATE INDEX IF NOT EXISTS idx_notification_history_type ON notification_history(notification_type)",
                 "CREATE INDEX IF NOT EXISTS idx_notification_history_sent ON notification_history(sent_at)",
+                # One row per (user, task, type): the unique key serialises concurrent
+                # claims in record_notification_if_not_sent without a transaction.
+                """
+                CREATE TABLE IF NOT EXISTS notification_claims (
+                    user_id BIGINT NOT NULL,
+                    task_id BIGINT NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
+                    notification_type TEXT NOT NULL,
+                    claimed_at TIMESTAMPTZ NOT NULL,
+                    PRIMARY KEY (user_id, task_id, notification_type)
+                )
+                """,
+                # Channel digest probe in check_channel_digest_sent (rows without a task)
+                "CREATE INDEX IF NOT EXISTS idx_notification_history_channel_digest ON notification_history(guild_id, notification_type, (notification_data->>'channel_id'), sent_at DESC) WHERE task_id IS NULL",
                 # Snoozed reminders
                 """
                 CREATE TABLE IF NOT EXISTS snoozed_reminders (
@@ -248,7 +493,7 @@ class Database:
                     task_id BIGINT NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
                     notification_type TEXT NOT NULL,
                     snoozed_at TEXT NOT NULL,
-                    snooze_until TEXT NOT NULL,
+                    snooze_until TIMESTAMPTZ NOT NULL,
                     created_at TEXT NOT NULL
                 )
                 """,
@@ -272,61 +517,154 @@ class Database:
                 """,
                 "CREATE INDEX IF NOT EXISTS idx_custom_rules_user ON custom_reminder_rules(user_id)",
                 "CREATE INDEX IF NOT EXISTS idx_custom_rules_guild ON custom_reminder_rules(guild_id)",
+                # Move the timestamps the hot paths compare and sort on from ISO text to
+                # TIMESTAMPTZ. Values without an offset were always written as UTC; only a
+                # suffix after a time component counts as an offset (the "-01" of a bare
+                # date does not). Blank values become NULL, or the migration time where
+                # the column is NOT NULL.
+                """
+                DO $$
+                DECLARE
+                    target RECORD;
+                BEGIN
+                    FOR target IN
+                        SELECT table_name, column_name, is_nullable
+                        FROM information_schema.columns
+                        WHERE table_schema = current_schema()
+                          AND data_type = 'text'
+                          AND (table_name, column_name) IN (
+                              ('tasks', 'due_date'),
+                              ('tasks', 'created_at'),
+                              ('task_assignees', 'assigned_at'),
+                              ('notification_history', 'sent_at'),
+                              ('snoozed_reminders', 'snooze_until')
+                          )
+                    LOOP
+                        EXECUTE format(
+                            'ALTER TABLE %1$I ALTER COLUMN %2$I TYPE TIMESTAMPTZ USING CASE '
+                            'WHEN btrim(%2$I) = '''' THEN %3$s '
+                            'WHEN %2$I ~* ''[T ][0-9]{2}:[0-9]{2}(:[0-9]{2}([.][0-9]+)?)? ?(Z|[+-][0-9]{2}(:?[0-9]{2})?)$'' '
+                            'THEN %2$I::timestamptz '
+                            'ELSE %2$I::timestamp AT TIME ZONE ''UTC'' END',
+                            target.table_name,
+                            target.column_name,
+                            CASE WHEN target.is_nullable = 'NO' THEN 'NOW()' ELSE 'NULL' END
+                        );
+                    END LOOP;
+                END
+                $$
+                """,
             ]
-            for statement in schema_statements:
-                await conn.execute(statement)
+            # Parameterless, so asyncpg sends the whole batch as one simple-query message.
+            # The runtime lock/statement timeouts do not apply to the bootstrap: a migration
+            # that gives up half way would roll back and fail the same way on every restart.
+            async with conn.transaction():
+                await conn.execute("SET LOCAL lock_timeout = 0; SET LOCAL statement_timeout = 0")
+                await conn.execute(";\n".join(schema_statements), timeout=SCHEMA_BOOTSTRAP_TIMEOUT)
+            rows = await conn.fetch("SELECT guild_id FROM guilds")
+            self._known_guilds.update(row[0] for row in rows)
 
     async def close(self) -> None:
+        vote_flush = self._vote_flush
+        if vote_flush is not None:
+            # Let the cancelled flush put any in-flight deltas back before the final write.
+            vote_flush.cancel()
+            await asyncio.wait([vote_flush])
+            self._vote_flush = None
         if self._pool:
-            await self._pool.close()
-            self._pool = None
+            try:
+                await self.flush_feature_votes()
+            finally:
+                await self._pool.close()
+                self._pool = None
 
     async def ensure_guild(self, guild_id: int, *, reminder_time: Optional[str] = None) -> None:
+        if guild_id in self._known_guilds:
+            return
         await self._execute(
             "INSERT INTO guilds (guild_id, reminder_time) VALUES ($1, $2) ON CONFLICT(guild_id) DO NOTHING",
             (guild_id, reminder_time or self.default_reminder),
         )
+        self._known_guilds.add(guild_id)
 
     async def set_notifications(self, guild_id: int, enabled: bool) -> None:
-        await self.ensure_guild(guild_id)
         await self._execute(
-            "UPDATE guilds SET notify_enabled = $1 WHERE guild_id = $2",
-            (enabled, guild_id),
+            """
+            INSERT INTO guilds (guild_id, reminder_time, notify_enabled) VALUES ($1, $2, $3)
+            ON CONFLICT (guild_id) DO UPDATE SET notify_enabled = EXCLUDED.notify_enabled
+            """,
+            (guild_id, self.default_reminder, enabled),
         )
+        self._known_guilds.add(guild_id)
+        self._guild_cache.pop(guild_id)
 
     async def get_guild_settings(self, guild_id: int) -> Dict[str, Any]:
-        await self.ensure_guild(guild_id)
-        row = await self._execute(
-            "SELECT * FROM guilds WHERE guild_id = $1",
-            (guild_id,),
-            fetchone=True,
-        )
-        return dict(row) if row else {}
-
-    async def list_guilds(self) -> List[Dict[str, Any]]:
-        rows = await self._execute(
+        row = self._guild_cache.get(guild_id)
+        if row is None:
+            # Read the row, creating it with defaults only if it is missing, in one round trip
+            row = await self._execute(
+                """
+                WITH existing AS (
+                    SELECT * FROM guilds WHERE guild_id = $1
+                ), created AS (
+                    INSERT INTO guilds (guild_id, reminder_time)
+                    SELECT $1, $2 WHERE NOT EXISTS (SELECT 1 FROM existing)
+                    ON CONFLICT (guild_id) DO NOTHING
+                    RETURNING *
+                )
+                SELECT * FROM existing UNION ALL SELECT * FROM created
+                """,
+                (guild_id, self.default_reminder),
+                fetchone=True,
+            )
+            if not row:
+                # A concurrent insert won the race: the CTE's snapshot missed it and
+                # ON CONFLICT skipped ours, but the committed row is visible now.
+                row = await self._execute(
+                    "SELECT * FROM guilds WHERE guild_id = $1",
+                    (guild_id,),
+                    fetchone=True,
+                )
+                if not row:
+                    return {}
+            self._known_guilds.add(guild_id)
+            self._guild_cache.set(guild_id, row)
+        return dict(row)
+
+    async def list_guilds(self) -> List[asyncpg.Record]:
+        return await self._execute(
             "SELECT * FROM guilds",
             fetchall=True,
         )
-        return [dict(row) for row in rows or []]
 
     async def set_reminder_time(self, guild_id: int, reminder_time: str) -> None:
-        await self.ensure_guild(guild_id)
         await self._execute(
-            "UPDATE guilds SET reminder_time = $1 WHERE guild_id = $2",
-            (reminder_time, guild_id),
+            """
+            INSERT INTO guilds (guild_id, reminder_time) VALUES ($1, $2)
+            ON CONFLICT (guild_id) DO UPDATE SET reminder_time = EXCLUDED.reminder_time
+            """,
+            (guild_id, reminder_time),
         )
+        self._known_guilds.add(guild_id)
+        self._guild_cache.pop(guild_id)
 
     # FR-10: Completion policy methods
     async def set_guild_completion_policy(
         self, guild_id: int, assignee_only: bool, allowed_role_ids: List[int]
     ) -> None:
         """Set guild-level completion policy."""
-        await self.ensure_guild(guild_id)
         await self._execute(
-            "UPDATE guilds SET completion_assignee_only = $1, completion_allowed_roles = $2 WHERE guild_id = $3",
-            (assignee_only, allowed_role_ids, guild_id),
+            """
+            INSERT INTO guilds (guild_id, reminder_time, completion_assignee_only, completion_allowed_roles)
+            VALUES ($1, $2, $3, $4)
+            ON CONFLICT (guild_id) DO UPDATE
+            SET completion_assignee_only = EXCLUDED.completion_assignee_only,
+                completion_allowed_roles = EXCLUDED.completion_allowed_roles
+            """,
+            (guild_id, self.default_reminder, assignee_only, allowed_role_ids),
         )
+        self._known_guilds.add(guild_id)
+        self._guild_cache.pop(guild_id)
 
     async def set_board_completion_policy(
         self, board_id: int, assignee_only: Optional[bool], allowed_role_ids: Optional[List[int]]
@@ -416,9 +754,9 @@ class Database:
             (board_id,),
         )
 
-    async def list_board_views(self, guild_id: int) -> List[Dict[str, Any]]:
+    async def list_board_views(self, guild_id: int) -> List[asyncpg.Record]:
         """List all board views for a guild."""
-        rows = await self._execute(
+        return await self._execute(
             """
             SELECT bv.* FROM board_views bv
             JOIN boards b ON bv.board_id = b.id AND (b.deleted_at IS NULL)
@@ -427,7 +765,6 @@ class Database:
             (guild_id,),
             fetchall=True,
         )
-        return [dict(row) for row in rows or []]
 
     async def create_board(
         self,
@@ -438,19 +775,25 @@ class Database:
         created_by: int,
     ) -> int:
         await self.ensure_guild(guild_id)
-        board_row = await self._execute(
+        # One statement inserts the board and seeds its default columns atomically.
+        board_id = await self._execute(
             """
-            INSERT INTO boards (guild_id, channel_id, name, description, created_by, created_at)
-            VALUES ($1, $2, $3, $4, $5, $6)
-            RETURNING id
+            WITH new_board AS (
+                INSERT INTO boards (guild_id, channel_id, name, description, created_by, created_at)
+                VALUES ($1, $2, $3, $4, $5, $6)
+                RETURNING id
+            ), seeded AS (
+                INSERT INTO columns (board_id, name, position)
+                SELECT new_board.id, c.name, c.ord - 1
+                FROM new_board, unnest($7::text[]) WITH ORDINALITY AS c(name, ord)
+            )
+            SELECT id FROM new_board
             """,
-            (guild_id, channel_id, name, description, created_by, _utcnow()),
-            fetchone=True,
+            (guild_id, channel_id, name, description, created_by, _utcnow(), list(DEFAULT_COLUMNS)),
+            fetchval=True,
         )
-        if not board_row:
+        if board_id is None:
             raise RuntimeError("Failed to create board")
-        board_id = board_row["id"]
-        await self._add_default_columns(board_id)
         return board_id
 
     async def delete_board(self, guild_id: int, board_id: int) -> bool:
@@ -462,14 +805,13 @@ class Database:
         )
         return bool(result)
 
-    async def fetch_boards(self, guild_id: int) -> List[Dict[str, Any]]:
-        """Fetch all non-deleted boards for a guild."""
-        rows = await self._execute(
+    async def fetch_boards(self, guild_id: int) -> List[asyncpg.Record]:
+        """Fetch all non-deleted boards for a guild (read-only mapping rows)."""
+        return await self._execute(
             "SELECT * FROM boards WHERE guild_id = $1 AND (deleted_at IS NULL) ORDER BY created_at DESC",
             (guild_id,),
             fetchall=True,
         )
-        return [dict(row) for row in rows or []]
 
     async def get_board(self, guild_id: int, board_id: int) -> Optional[Dict[str, Any]]:
         """Get a non-deleted board by ID."""
@@ -489,53 +831,84 @@ class Database:
         )
         return dict(row) if row else None
 
-    async def fetch_columns(self, board_id: int) -> List[Dict[str, Any]]:
-        """Fetch all non-deleted columns for a board."""
-        rows = await self._execute(
+    async def fetch_columns(self, board_id: int) -> List[asyncpg.Record]:
+        """Fetch all non-deleted columns for a board (read-only mapping rows)."""
+        return await self._execute(
             "SELECT * FROM columns WHERE board_id = $1 AND (deleted_at IS NULL) ORDER BY position",
             (board_id,),
             fetchall=True,
         )
-        return [dict(row) for row in rows or []]
+
+    async def fetch_board_overview(self, board_id: int) -> Dict[str, Any]:
+        """Fetch a board's columns and tasks concurrently.
+
+        Each query runs on its own pooled connection, so the round trips overlap.
+        """
+        columns, tasks = await asyncio.gather(self.fetch_columns(board_id), self.fetch_tasks(board_id))
+        return {"columns": columns, "tasks": tasks}
 
     async def add_column(self, board_id: int, name: str) -> int:
-        columns = await self.fetch_columns(board_id)
-        position = (columns[-1]["position"] + 1) if columns else 0
-        column_row = await self._execute(
-            """
-            INSERT INTO columns (board_id, name, position)
-            VALUES ($1, $2, $3)
-            RETURNING id
-            """,
-            (board_id, name, position),
-            fetchone=True,
-        )
-        if not column_row:
+        async with self._transaction() as conn:
+            # Serialise column adds per board: the board row lock must be taken in an
+            # earlier statement so the INSERT's snapshot sees a concurrent add's MAX(position).
+            await self._execute(
+                "SELECT 1 FROM boards WHERE id = $1 FOR UPDATE",
+                (board_id,),
+                conn=conn,
+            )
+            column_id = await self._execute(
+                """
+                INSERT INTO columns (board_id, name, position)
+                SELECT $1, $2, COALESCE(MAX(position) + 1, 0)
+                FROM columns
+                WHERE board_id = $1 AND (deleted_at IS NULL)
+                RETURNING id
+                """,
+                (board_id, name),
+                fetchval=True,
+                conn=conn,
+            )
+        if column_id is None:
             raise RuntimeError("Failed to add column")
-        return column_row["id"]
+        return column_id
 
     async def remove_column(self, board_id: int, name: str) -> bool:
         """Soft delete a column by setting deleted_at timestamp."""
-        column = await self._execute(
-            "SELECT id FROM columns WHERE board_id = $1 AND name = $2 AND (deleted_at IS NULL)",
-            (board_id, name),
+        # Lookup, emptiness check and soft delete in one statement. FOR UPDATE on the
+        # column blocks tasks from being inserted into it until the statement commits.
+        row = await self._execute(
+            """
+            WITH target AS (
+                SELECT id FROM columns
+                WHERE board_id = $1 AND name = $2 AND (deleted_at IS NULL)
+                FOR UPDATE
+            ), blocked AS (
+                SELECT EXISTS (
+                    SELECT 1 FROM tasks t
+                    JOIN target ON t.column_id = target.id
+                    WHERE t.board_id = $1 AND (t.deleted_at IS NULL)
+                ) AS has_tasks
+            ), removed AS (
+                UPDATE columns SET deleted_at = $3
+                FROM target, blocked
+                WHERE columns.id = target.id AND NOT blocked.has_tasks
+                RETURNING columns.id
+            )
+            SELECT
+                (SELECT id FROM target) AS id,
+                (SELECT has_tasks FROM blocked) AS has_tasks,
+                EXISTS (SELECT 1 FROM removed) AS removed
+            """,
+            (board_id, name, _utcnow()),
             fetchone=True,
         )
-        if not column:
+        if row["id"] is None:
             return False
-        tasks = await self._execute(
-            "SELECT COUNT(1) as c FROM tasks WHERE column_id = $1 AND (deleted_at IS NULL)",
-            (column["id"],),
-            fetchone=True,
-        )
-        if tasks and tasks["c"]:
+        if row["has_tasks"]:
             raise ValueError("Column still has tasks. Move them before deleting.")
-        result = await self._execute(
-            "UPDATE columns SET deleted_at = $1 WHERE id = $2 AND deleted_at IS NULL",
-            (_utcnow(), column["id"]),
-            rowcount=True,
-        )
-        return bool(result)
+        self._column_cache.pop(row["id"])
+        self._column_cache.pop(("name", board_id, name.lower()))
+        return row["removed"]
 
     async def create_task(
         self,
@@ -544,23 +917,24 @@ class Database:
         title: str,
         description: Optional[str],
         assignee_id: Optional[int],
-        due_date: Optional[str],
+        due_date: Optional[Union[datetime, str]],
         created_by: int,
         assignee_ids: Optional[List[int]] = None,
     ) -> int:
         """Create a task with optional single assignee (for backwards compat) or multiple assignees."""
-        task_row = await self._execute(
+        if due_date is not None:
+            due_date = to_datetime(due_date)
+        task_id = await self._execute(
             """
             INSERT INTO tasks (board_id, column_id, title, description, assignee_id, due_date, created_by, created_at)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, NOW())
             RETURNING id
             """,
-            (board_id, column_id, title, description, assignee_id, due_date, created_by, _utcnow()),
-            fetchone=True,
+            (board_id, column_id, title, description, assignee_id, due_date, created_by),
+            fetchval=True,
         )
-        if not task_row:
+        if task_id is None:
             raise RuntimeError("Failed to create task")
-        task_id = task_row["id"]
         
         # Handle multiple assignees (preferred method)
         if assignee_ids:
@@ -578,14 +952,14 @@ class Database:
         column_id: Optional[int] = None,
         assignee_id: Optional[int] = None,
         include_completed: bool = True,
-    ) -> List[Dict[str, Any]]:
-        """Fetch tasks, optionally filtered by column or assignee. Returns tasks with assignee_ids list."""
+    ) -> List[asyncpg.Record]:
+        """Fetch tasks, optionally filtered by column or assignee, as read-only mapping rows with an assignee_ids list."""
         query = [
-            """
-            SELECT t.*, 
+            f"""
+            SELECT {_TASK_LIST_PROJECTION},
                    COALESCE(
-                       json_agg(DISTINCT ta.user_id) FILTER (WHERE ta.user_id IS NOT NULL),
-                       '[]'::json
+                       array_agg(DISTINCT ta.user_id) FILTER (WHERE ta.user_id IS NOT NULL),
+                       ARRAY[]::bigint[]
                    ) as assignee_ids
             FROM tasks t
             JOIN boards b ON t.board_id = b.id AND (b.deleted_at IS NULL)
@@ -604,20 +978,41 @@ class Database:
         if not include_completed:
             query.append("AND t.completed = FALSE")
         query.append("GROUP BY t.id ORDER BY t.created_at DESC")
-        rows = await self._execute(" ".join(query), tuple(params), fetchall=True)
-        tasks = []
-        for row in rows or []:
-            task_dict = dict(row)
-            # Convert JSON array to Python list
-            if isinstance(task_dict.get("assignee_ids"), list):
-                task_dict["assignee_ids"] = task_dict["assignee_ids"]
-            elif task_dict.get("assignee_ids"):
-                import json
-                task_dict["assignee_ids"] = json.loads(task_dict["assignee_ids"]) if isinstance(task_dict["assignee_ids"], str) else []
-            else:
-                task_dict["assignee_ids"] = []
-            tasks.append(task_dict)
-        return tasks
+        return await self._execute(" ".join(query), tuple(params), fetchall=True)
+
+    async def fetch_tasks_for_boards(
+        self,
+        board_ids: Sequence[int],
+        *,
+        include_completed: bool = True,
+    ) -> Dict[int, List[asyncpg.Record]]:
+        """Fetch tasks for several boards in one query, grouped by board_id.
+
+        Every requested board gets an entry, empty if it has no matching tasks.
+        """
+        tasks_by_board: Dict[int, List[asyncpg.Record]] = {board_id: [] for board_id in board_ids}
+        if not tasks_by_board:
+            return tasks_by_board
+        completed_filter = "" if include_completed else "AND t.completed = FALSE"
+        rows = await self._execute(
+            f"""
+            SELECT {_TASK_LIST_PROJECTION},
+                   COALESCE(
+                       array_agg(DISTINCT ta.user_id) FILTER (WHERE ta.user_id IS NOT NULL),
+                       ARRAY[]::bigint[]
+                   ) as assignee_ids
+            FROM tasks t
+            JOIN boards b ON t.board_id = b.id AND (b.deleted_at IS NULL)
+            LEFT JOIN task_assignees ta ON t.id = ta.task_id
+            WHERE t.board_id = ANY($1::bigint[]) AND (t.deleted_at IS NULL) {completed_filter}
+            GROUP BY t.id ORDER BY t.created_at DESC
+            """,
+            (list(tasks_by_board),),
+            fetchall=True,
+        )
+        for row in rows:
+            tasks_by_board[row["board_id"]].append(row)
+        return tasks_by_board
 
     async def fetch_task(self, task_id: int) -> Optional[Dict[str, Any]]:
         """Fetch a single task with its assignee_ids list."""
@@ -625,8 +1020,8 @@ class Database:
             """
             SELECT t.*,
                    COALESCE(
-                       json_agg(DISTINCT ta.user_id) FILTER (WHERE ta.user_id IS NOT NULL),
-                       '[]'::json
+                       array_agg(DISTINCT ta.user_id) FILTER (WHERE ta.user_id IS NOT NULL),
+                       ARRAY[]::bigint[]
                    ) as assignee_ids
             FROM tasks t
             JOIN boards b ON t.board_id = b.id AND (b.deleted_at IS NULL)
@@ -637,44 +1032,48 @@ class Database:
             (task_id,),
             fetchone=True,
         )
-        if not row:
-            return None
-        task_dict = dict(row)
-        # Convert JSON array to Python list
-        if isinstance(task_dict.get("assignee_ids"), list):
-            task_dict["assignee_ids"] = task_dict["assignee_ids"]
-        elif task_dict.get("assignee_ids"):
-            import json
-            task_dict["assignee_ids"] = json.loads(task_dict["assignee_ids"]) if isinstance(task_dict["assignee_ids"], str) else []
-        else:
-            task_dict["assignee_ids"] = []
-        return task_dict
+        return dict(row) if row else None
 
     async def update_task(self, task_id: int, **fields: Any) -> bool:
+        """Update the given task columns; returns whether the task exists.
+
+        Rows whose values already match are left untouched, so no-op edits write no WAL.
+        """
         if not fields:
             return False
-        assignments = []
-        params: List[Any] = []
-        for idx, (key, value) in enumerate(fields.items(), start=1):
-            assignments.append(f"{key} = ${idx}")
-            params.append(value)
+        if fields.get("due_date") is not None:
+            fields["due_date"] = to_datetime(fields["due_date"])
+        key = tuple(sorted(fields))
+        query = self._update_task_sql.get(key)
+        if query is None:
+            unknown = set(key) - (_TASK_COLUMNS - {"id"})
+            if unknown:
+                raise ValueError(f"Unknown task columns: {', '.join(sorted(unknown))}")
+            assignments = ", ".join(f"{name} = ${idx}" for idx, name in enumerate(key, start=1))
+            current = ", ".join(key)
+            values = ", ".join(f"${idx}" for idx in range(1, len(key) + 1))
+            query = f"""
+            WITH target AS (
+                SELECT id FROM tasks
+                WHERE id = ${len(key) + 1}
+                  AND deleted_at IS NULL
+                  AND EXISTS (
+                      SELECT 1 FROM boards b
+                      WHERE b.id = tasks.board_id
+                        AND b.deleted_at IS NULL
+                  )
+            ), updated AS (
+                UPDATE tasks
+                SET {assignments}
+                WHERE id IN (SELECT id FROM target)
+                  AND ROW({current}) IS DISTINCT FROM ROW({values})
+            )
+            SELECT EXISTS (SELECT 1 FROM target)
+            """
+            self._update_task_sql[key] = query
+        params = [fields[name] for name in key]
         params.append(task_id)
-        result = await self._execute(
-            f"""
-            UPDATE tasks 
-            SET {', '.join(assignments)} 
-            WHERE id = ${len(params)} 
-              AND deleted_at IS NULL
-              AND EXISTS (
-                  SELECT 1 FROM boards b 
-                  WHERE b.id = tasks.board_id 
-                    AND b.deleted_at IS NULL
-              )
-            """,
-            tuple(params),
-            rowcount=True,
-        )
-        return bool(result)
+        return bool(await self._execute(query, tuple(params), fetchval=True))
 
     async def delete_task(self, task_id: int) -> bool:
         """Soft delete a task by setting deleted_at timestamp."""
@@ -710,21 +1109,21 @@ class Database:
         Returns False if recovery would cause a name conflict with an existing active board.
         """
         # First, check if there's a name conflict with an active board
-        deleted_board = await self._execute(
+        deleted_name = await self._execute(
             "SELECT name FROM boards WHERE guild_id = $1 AND id = $2 AND deleted_at IS NOT NULL",
             (guild_id, board_id),
-            fetchone=True,
+            fetchval=True,
         )
-        if not deleted_board:
+        if deleted_name is None:
             return False  # Board not found or not deleted
         
         # Check for name conflict with active board
         conflict = await self._execute(
             "SELECT id FROM boards WHERE guild_id = $1 AND name = $2 AND deleted_at IS NULL",
-            (guild_id, deleted_board["name"]),
-            fetchone=True,
+            (guild_id, deleted_name),
+            fetchval=True,
         )
-        if conflict:
+        if conflict is not None:
             return False  # Name conflict - active board with same name exists
         
         # Safe to recover
@@ -741,21 +1140,21 @@ class Database:
         Returns False if recovery would cause a name conflict with an existing active column.
         """
         # First, check if there's a name conflict with an active column
-        deleted_column = await self._execute(
+        deleted_name = await self._execute(
             "SELECT name FROM columns WHERE board_id = $1 AND id = $2 AND deleted_at IS NOT NULL",
             (board_id, column_id),
-            fetchone=True,
+            fetchval=True,
         )
-        if not deleted_column:
+        if deleted_name is None:
             return False  # Column not found or not deleted
         
         # Check for name conflict with active column
         conflict = await self._execute(
             "SELECT id FROM columns WHERE board_id = $1 AND name = $2 AND deleted_at IS NULL",
-            (board_id, deleted_column["name"]),
-            fetchone=True,
+            (board_id, deleted_name),
+            fetchval=True,
         )
-        if conflict:
+        if conflict is not None:
             return False  # Name conflict - active column with same name exists
         
         # Safe to recover
@@ -764,33 +1163,32 @@ class Database:
             (board_id, column_id),
             rowcount=True,
         )
+        self._column_cache.pop(column_id)
         return bool(result)
     
-    async def fetch_deleted_boards(self, guild_id: int) -> List[Dict[str, Any]]:
+    async def fetch_deleted_boards(self, guild_id: int) -> List[asyncpg.Record]:
         """Fetch soft-deleted boards for a guild."""
-        rows = await self._execute(
+        return await self._execute(
             "SELECT * FROM boards WHERE guild_id = $1 AND deleted_at IS NOT NULL ORDER BY deleted_at DESC",
             (guild_id,),
             fetchall=True,
         )
-        return [dict(row) for row in rows or []]
     
-    async def fetch_deleted_columns(self, board_id: int) -> List[Dict[str, Any]]:
+    async def fetch_deleted_columns(self, board_id: int) -> List[asyncpg.Record]:
         """Fetch soft-deleted columns for a board."""
-        rows = await self._execute(
+        return await self._execute(
             "SELECT * FROM columns WHERE board_id = $1 AND deleted_at IS NOT NULL ORDER BY deleted_at DESC",
             (board_id,),
             fetchall=True,
         )
-        return [dict(row) for row in rows or []]
     
-    async def fetch_deleted_tasks(self, guild_id: int, board_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    async def fetch_deleted_tasks(self, guild_id: int, board_id: Optional[int] = None) -> List[asyncpg.Record]:
         """Fetch soft-deleted tasks for a guild or board."""
         query = """
             SELECT t.*,
                    COALESCE(
-                       json_agg(DISTINCT ta.user_id) FILTER (WHERE ta.user_id IS NOT NULL),
-                       '[]'::json
+                       array_agg(DISTINCT ta.user_id) FILTER (WHERE ta.user_id IS NOT NULL),
+                       ARRAY[]::bigint[]
                    ) as assignee_ids,
                    boards.name AS board_name,
                    boards.guild_id
@@ -805,98 +1203,71 @@ class Database:
             params.append(board_id)
         query += " GROUP BY t.id, boards.name, boards.guild_id ORDER BY t.deleted_at DESC"
         
-        rows = await self._execute(query, tuple(params), fetchall=True)
-        tasks = []
-        for row in rows or []:
-            task_dict = dict(row)
-            # Convert JSON array to Python list
-            if isinstance(task_dict.get("assignee_ids"), list):
-                task_dict["assignee_ids"] = task_dict["assignee_ids"]
-            elif task_dict.get("assignee_ids"):
-                import json
-                task_dict["assignee_ids"] = json.loads(task_dict["assignee_ids"]) if isinstance(task_dict["assignee_ids"], str) else []
-            else:
-                task_dict["assignee_ids"] = []
-            tasks.append(task_dict)
-        return tasks
+        return await self._execute(query, tuple(params), fetchall=True)
     
     # Multiple assignees management methods
     async def add_task_assignees(self, task_id: int, user_ids: List[int]) -> None:
         """Add one or more assignees to a task."""
         if not user_ids:
             return
-        now = _utcnow()
-        for user_id in user_ids:
-            await self._execute(
-                """
+        # Insert every assignee and backfill the legacy assignee_id (first assignee) in one round trip
+        await self._execute(
+            """
+            WITH added AS (
                 INSERT INTO task_assignees (task_id, user_id, assigned_at)
-                VALUES ($1, $2, $3)
+                SELECT $1, uid, NOW() FROM unnest($2::bigint[]) AS uid
                 ON CONFLICT (task_id, user_id) DO NOTHING
-                """,
-                (task_id, user_id, now),
             )
-        # Also update legacy assignee_id field for backwards compatibility (use first assignee)
-        existing = await self._execute(
-            "SELECT assignee_id FROM tasks WHERE id = $1",
-            (task_id,),
-            fetchone=True,
+            UPDATE tasks SET assignee_id = COALESCE(assignee_id, $3) WHERE id = $1
+            """,
+            (task_id, list(user_ids), user_ids[0]),
         )
-        if existing and not existing.get("assignee_id"):
-            await self._execute(
-                "UPDATE tasks SET assignee_id = $1 WHERE id = $2",
-                (user_ids[0], task_id),
-            )
     
     async def remove_task_assignees(self, task_id: int, user_ids: List[int]) -> None:
         """Remove one or more assignees from a task."""
         if not user_ids:
             return
+        # Delete and re-point the legacy assignee_id at the earliest remaining assignee in
+        # one round trip. The subquery runs on the pre-DELETE snapshot, so it skips the
+        # removed users explicitly.
         await self._execute(
-            "DELETE FROM task_assignees WHERE task_id = $1 AND user_id = ANY($2::bigint[])",
-            (task_id, user_ids),
-        )
-        # Update legacy assignee_id if we removed the last assignee or the one in assignee_id
-        remaining = await self._execute(
-            "SELECT user_id FROM task_assignees WHERE task_id = $1 ORDER BY assigned_at LIMIT 1",
-            (task_id,),
-            fetchone=True,
-        )
-        if remaining:
-            await self._execute(
-                "UPDATE tasks SET assignee_id = $1 WHERE id = $2",
-                (remaining["user_id"], task_id),
+            """
+            WITH removed AS (
+                DELETE FROM task_assignees WHERE task_id = $1 AND user_id = ANY($2::bigint[])
             )
-        else:
-            await self._execute(
-                "UPDATE tasks SET assignee_id = NULL WHERE id = $1",
-                (task_id,),
+            UPDATE tasks
+            SET assignee_id = (
+                SELECT user_id FROM task_assignees
+                WHERE task_id = $1 AND user_id <> ALL($2::bigint[])
+                ORDER BY assigned_at
+                LIMIT 1
             )
+            WHERE id = $1
+            """,
+            (task_id, list(user_ids)),
+        )
     
     async def set_task_assignees(self, task_id: int, user_ids: List[int]) -> None:
-        """Replace all assignees for a task with the given list."""
-        # Update legacy assignee_id FIRST to keep it in sync
-        # This ensures backwards compatibility even if add_task_assignees doesn't update it
-        if user_ids:
-            await self._execute(
-                "UPDATE tasks SET assignee_id = $1 WHERE id = $2",
-                (user_ids[0], task_id),
-            )
-        else:
-            await self._execute(
-                "UPDATE tasks SET assignee_id = NULL WHERE id = $1",
-                (task_id,),
-            )
-        
-        # Remove all existing assignees
+        """Replace all assignees for a task with the given list.
+
+        Users already assigned keep their row (and assigned_at); only the others change.
+        """
+        # Drop, add and sync the legacy assignee_id in one statement. The DELETE and
+        # INSERT touch disjoint rows, since retained users hit ON CONFLICT DO NOTHING.
         await self._execute(
-            "DELETE FROM task_assignees WHERE task_id = $1",
-            (task_id,),
+            """
+            WITH removed AS (
+                DELETE FROM task_assignees WHERE task_id = $1 AND user_id <> ALL($2::bigint[])
+            ), added AS (
+                INSERT INTO task_assignees (task_id, user_id, assigned_at)
+                SELECT $1, uid, NOW() FROM unnest($2::bigint[]) AS uid
+                ON CONFLICT (task_id, user_id) DO NOTHING
+            )
+            UPDATE tasks SET assignee_id = $3 WHERE id = $1
+            """,
+            (task_id, list(user_ids), user_ids[0] if user_ids else None),
         )
-        
-        # Add new assignees
-        if user_ids:
-            await self.add_task_assignees(task_id, user_ids)
-    
+
     async def get_task_assignees(self, task_id: int) -> List[int]:
         """Get list of user IDs assigned to a task."""
         rows = await self._execute(
@@ -904,19 +1275,19 @@ class Database:
             (task_id,),
             fetchall=True,
         )
-        return [row["user_id"] for row in rows or []]
+        return [row[0] for row in rows or []]
 
-    async def search_tasks(self, guild_id: int, query: str) -> List[Dict[str, Any]]:
+    async def search_tasks(self, guild_id: int, query: str) -> List[asyncpg.Record]:
         """Search tasks with assignee_ids included."""
         like = f"%{query}%"
-        rows = await self._execute(
-            """
-            SELECT t.*, 
+        return await self._execute(
+            f"""
+            SELECT {_TASK_LIST_PROJECTION},
                    boards.name AS board_name, 
                    boards.channel_id,
                    COALESCE(
-                       json_agg(DISTINCT ta.user_id) FILTER (WHERE ta.user_id IS NOT NULL),
-                       '[]'::json
+                       array_agg(DISTINCT ta.user_id) FILTER (WHERE ta.user_id IS NOT NULL),
+                       ARRAY[]::bigint[]
                    ) as assignee_ids
             FROM tasks t
             JOIN boards ON t.board_id = boards.id AND (boards.deleted_at IS NULL)
@@ -934,177 +1305,139 @@ class Database:
             (guild_id, like, like),
             fetchall=True,
         )
-        tasks = []
-        for row in rows or []:
-            task_dict = dict(row)
-            # Convert JSON array to Python list
-            if isinstance(task_dict.get("assignee_ids"), list):
-                task_dict["assignee_ids"] = task_dict["assignee_ids"]
-            elif task_dict.get("assignee_ids"):
-                import json
-                task_dict["assignee_ids"] = json.loads(task_dict["assignee_ids"]) if isinstance(task_dict["assignee_ids"], str) else []
-            else:
-                task_dict["assignee_ids"] = []
-            tasks.append(task_dict)
-        return tasks
 
     async def board_stats(self, board_id: int) -> Dict[str, Any]:
-        totals = await self._execute(
+        row = await self._execute(
             """
             SELECT
                 COUNT(1) AS total,
-                SUM(CASE WHEN completed THEN 1 ELSE 0 END) AS completed
+                COUNT(1) FILTER (WHERE completed) AS completed,
+                COUNT(1) FILTER (
+                    WHERE completed = FALSE AND due_date IS NOT NULL AND due_date < NOW()
+                ) AS overdue
             FROM tasks
             WHERE board_id = $1
             """,
             (board_id,),
             fetchone=True,
         )
-        overdue = await self._execute(
-            """
-            SELECT COUNT(1) AS overdue
-            FROM tasks
-            WHERE board_id = $1 AND completed = FALSE AND due_date IS NOT NULL AND due_date < $2
-            """,
-            (board_id, _utcnow()),
-            fetchone=True,
-        )
         return {
-            "total": totals["total"] if totals else 0,
-            "completed": totals["completed"] if totals else 0,
-            "overdue": overdue["overdue"] if overdue else 0,
+            "total": row["total"] if row else 0,
+            "completed": row["completed"] if row else 0,
+            "overdue": row["overdue"] if row else 0,
         }
 
     async def board_stats_detailed(self, board_id: int) -> Dict[str, Any]:
         """Get detailed board statistics including per-column breakdown."""
-        # Get basic totals
-        totals = await self._execute(
+        # Totals, overdue, due-this-week and the per-column breakdown in one round trip
+        row = await self._execute(
             """
-            SELECT
-                COUNT(1) AS total,
-                SUM(CASE WHEN completed THEN 1 ELSE 0 END) AS completed,
-                SUM(CASE WHEN completed = FALSE THEN 1 ELSE 0 END) AS active
-            FROM tasks
-            WHERE board_id = $1
+            WITH totals AS (
+                SELECT
+                    COUNT(1) AS total,
+                    COUNT(1) FILTER (WHERE completed) AS completed,
+                    COUNT(1) FILTER (WHERE completed = FALSE) AS active,
+                    COUNT(1) FILTER (
+                        WHERE completed = FALSE AND due_date IS NOT NULL AND due_date < NOW()
+                    ) AS overdue,
+                    COUNT(1) FILTER (
+                        WHERE completed = FALSE AND due_date IS NOT NULL
+                          AND due_date >= NOW() AND due_date <= NOW() + INTERVAL '7 days'
+                    ) AS due_soon
+                FROM tasks
+                WHERE board_id = $1
+            ), column_counts AS (
+                SELECT column_id, COUNT(1) AS task_count
+                FROM tasks
+                WHERE board_id = $1 AND completed = FALSE AND (deleted_at IS NULL)
+                GROUP BY column_id
+            )
+            SELECT totals.*,
+                   (
+                       SELECT COALESCE(
+                           json_agg(
+                               json_build_object(
+                                   'id', c.id,
+                                   'name', c.name,
+                                   'task_count', COALESCE(cc.task_count, 0)
+                               )
+                               ORDER BY c.position
+                           ),
+                           '[]'::json
+                       )
+                       FROM columns c
+                       LEFT JOIN column_counts cc ON cc.column_id = c.id
+                       WHERE c.board_id = $1 AND (c.deleted_at IS NULL)
+                   ) AS column_breakdown
+            FROM totals
             """,
             (board_id,),
             fetchone=True,
         )
 
-        # Get overdue count
-        overdue = await self._execute(
-            """
-            SELECT COUNT(1) AS overdue
-            FROM tasks
-            WHERE board_id = $1 AND completed = FALSE AND due_date IS NOT NULL AND due_date < $2
-            """,
-            (board_id, _utcnow()),
-            fetchone=True,
-        )
-
-        # Get tasks due this week
-        from datetime import timedelta
-        week_later = datetime.now(timezone.utc) + timedelta(days=7)
-        due_this_week = await self._execute(
-            """
-            SELECT COUNT(1) AS due_soon
-            FROM tasks
-            WHERE board_id = $1 AND completed = FALSE AND due_date IS NOT NULL
-              AND due_date >= $2 AND due_date <= $3
-            """,
-            (board_id, _utcnow(), week_later.strftime(ISO_FORMAT)),
-            fetchone=True,
-        )
-
-        # Get per-column task counts
-        column_stats = await self._execute(
-            """
-            SELECT c.id, c.name, COUNT(t.id) AS task_count
-            FROM columns c
-            LEFT JOIN tasks t ON t.column_id = c.id AND t.completed = FALSE AND (t.deleted_at IS NULL)
-            WHERE c.board_id = $1 AND (c.deleted_at IS NULL)
-            GROUP BY c.id, c.name
-            ORDER BY c.position
-            """,
-            (board_id,),
-            fetchall=True,
-        )
-
         return {
-            "total": totals["total"] if totals else 0,
-            "completed": totals["completed"] if totals else 0,
-            "active": totals["active"] if totals else 0,
-            "overdue": overdue["overdue"] if overdue else 0,
-            "due_this_week": due_this_week["due_soon"] if due_this_week else 0,
-            "column_breakdown": [dict(row) for row in column_stats] if column_stats else [],
+            "total": row["total"] if row else 0,
+            "completed": row["completed"] if row else 0,
+            "active": row["active"] if row else 0,
+            "overdue": row["overdue"] if row else 0,
+            "due_this_week": row["due_soon"] if row else 0,
+            "column_breakdown": row["column_breakdown"] if row else [],
         }
 
-    async def fetch_due_tasks(self, before_iso: str) -> List[Dict[str, Any]]:
+    async def fetch_due_tasks(self, before: Union[datetime, str]) -> List[Dict[str, Any]]:
         """Fetch due tasks with assignee_ids for reminders."""
+        before = to_datetime(before)
         rows = await self._execute(
             """
             SELECT t.*, 
                    boards.name AS board_name, 
                    boards.channel_id, 
                    boards.guild_id,
-                   COALESCE(
-                       json_agg(DISTINCT ta.user_id) FILTER (WHERE ta.user_id IS NOT NULL),
-                       '[]'::json
-                   ) as assignee_ids
+                   COALESCE(a.assignee_ids, ARRAY[]::bigint[]) AS assignee_ids
             FROM tasks t
             JOIN boards ON t.board_id = boards.id AND (boards.deleted_at IS NULL)
-            LEFT JOIN task_assignees ta ON t.id = ta.task_id
+            LEFT JOIN LATERAL (
+                SELECT array_agg(ta.user_id ORDER BY ta.user_id) AS assignee_ids
+                FROM task_assignees ta
+                WHERE ta.task_id = t.id
+            ) a ON TRUE
             WHERE t.completed = FALSE AND t.due_date IS NOT NULL AND t.due_date <= $1
               AND (t.deleted_at IS NULL)
-            GROUP BY t.id, boards.name, boards.channel_id, boards.guild_id
             ORDER BY t.due_date ASC
             """,
-            (before_iso,),
+            (before,),
             fetchall=True,
         )
-        tasks = []
-        for row in rows or []:
-            task_dict = dict(row)
-            # Convert JSON array to Python list
-            if isinstance(task_dict.get("assignee_ids"), list):
-                task_dict["assignee_ids"] = task_dict["assignee_ids"]
-            elif task_dict.get("assignee_ids"):
-                import json
-                task_dict["assignee_ids"] = json.loads(task_dict["assignee_ids"]) if isinstance(task_dict["assignee_ids"], str) else []
-            else:
-                task_dict["assignee_ids"] = []
-            tasks.append(task_dict)
-        return tasks
-
-    async def _add_default_columns(self, board_id: int) -> None:
-        defaults = ["To Do", "In Progress", "Done"]
-        for position, name in enumerate(defaults):
-            await self._execute(
-                """
-                INSERT INTO columns (board_id, name, position)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (board_id, name) DO NOTHING
-                """,
-                (board_id, name, position),
-            )
+        return [dict(row) for row in rows]
 
     async def get_column_by_name(self, board_id: int, name: str) -> Optional[Dict[str, Any]]:
         """Get a non-deleted column by name."""
-        row = await self._execute(
-            "SELECT * FROM columns WHERE board_id = $1 AND LOWER(name) = LOWER($2) AND (deleted_at IS NULL)",
-            (board_id, name),
-            fetchone=True,
-        )
-        return dict(row) if row else None
+        key = ("name", board_id, name.lower())
+        row = self._column_cache.get(key)
+        if row is None:
+            row = await self._execute(
+                "SELECT * FROM columns WHERE board_id = $1 AND LOWER(name) = LOWER($2) AND (deleted_at IS NULL)",
+                (board_id, name),
+                fetchone=True,
+            )
+            if not row:
+                return None
+            self._column_cache.set(key, row)
+        return dict(row)
 
     async def get_column_by_id(self, column_id: int) -> Optional[Dict[str, Any]]:
         """Get a non-deleted column by ID."""
-        row = await self._execute(
-            "SELECT * FROM columns WHERE id = $1 AND (deleted_at IS NULL)",
-            (column_id,),
-            fetchone=True,
-        )
-        return dict(row) if row else None
+        row = self._column_cache.get(column_id)
+        if row is None:
+            row = await self._execute(
+                "SELECT * FROM columns WHERE id = $1 AND (deleted_at IS NULL)",
+                (column_id,),
+                fetchone=True,
+            )
+            if not row:
+                return None
+            self._column_cache.set(column_id, row)
+        return dict(row)
 
     async def move_task(self, task_id: int, column_id: int) -> bool:
         return await self.update_task(task_id, column_id=column_id)
@@ -1128,48 +1461,48 @@ class Database:
         suggested_priority: Optional[str],
     ) -> int:
         await self.ensure_guild(guild_id)
-        row = await self._execute(
+        feature_id = await self._execute(
             """
             INSERT INTO feature_requests (user_id, guild_id, title, suggestion, suggested_priority)
             VALUES ($1, $2, $3, $4, $5)
             RETURNING id
             """,
             (user_id, guild_id, title, suggestion, suggested_priority),
-            fetchone=True,
+            fetchval=True,
         )
-        if not row:
+        if feature_id is None:
             raise RuntimeError("Failed to store feature request")
-        return row["id"]
+        return feature_id
 
-    async def fetch_feature_requests(self) -> List[Dict[str, Any]]:
+    async def fetch_feature_requests(self) -> List[asyncpg.Record]:
         rows = await self._execute(
             "SELECT * FROM feature_requests ORDER BY created_at DESC",
             fetchall=True,
         )
-        return [dict(row) for row in rows or []]
+        return rows or []
 
     async def get_feature_request(self, feature_id: int, *, guild_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
-        if guild_id is not None:
-            row = await self._execute(
-                "SELECT * FROM feature_requests WHERE id = $1 AND guild_id = $2",
-                (feature_id, guild_id),
-                fetchone=True,
-            )
-        else:
+        row = self._feature_cache.get(feature_id)
+        if row is None:
             row = await self._execute(
                 "SELECT * FROM feature_requests WHERE id = $1",
                 (feature_id,),
                 fetchone=True,
             )
-        return dict(row) if row else None
+            if not row:
+                return None
+            self._feature_cache.set(feature_id, row)
+        if guild_id is not None and row["guild_id"] != guild_id:
+            return None
+        return dict(row)
 
-    async def fetch_feature_requests_by_guild(self, guild_id: int) -> List[Dict[str, Any]]:
+    async def fetch_feature_requests_by_guild(self, guild_id: int) -> List[asyncpg.Record]:
         rows = await self._execute(
             "SELECT * FROM feature_requests WHERE guild_id = $1 ORDER BY created_at DESC",
             (guild_id,),
             fetchall=True,
         )
-        return [dict(row) for row in rows or []]
+        return rows or []
 
     async def set_feature_request_message(
         self,
@@ -1187,6 +1520,7 @@ class Database:
             """,
             (message_id, channel_id, feature_id),
         )
+        self._feature_cache.pop(feature_id)
 
     async def get_feature_by_message(self, message_id: int) -> Optional[Dict[str, Any]]:
         row = await self._execute(
@@ -1204,16 +1538,63 @@ class Database:
         down_delta: int = 0,
         duplicate_delta: int = 0,
     ) -> None:
-        await self._execute(
-            """
-            UPDATE feature_requests
-            SET community_upvotes = GREATEST(community_upvotes + $1, 0),
-                community_downvotes = GREATEST(community_downvotes + $2, 0),
-                community_duplicate_votes = GREATEST(community_duplicate_votes + $3, 0)
-            WHERE id = $4
-            """,
-            (up_delta, down_delta, duplicate_delta, feature_id),
-        )
+        """Queue vote deltas; they are written within VOTE_FLUSH_DELAY seconds."""
+        pending = self._pending_votes.setdefault(feature_id, [0, 0, 0])
+        pending[0] += up_delta
+        pending[1] += down_delta
+        pending[2] += duplicate_delta
+        if self._vote_flush is None:
+            self._vote_flush = asyncio.get_running_loop().create_task(self._flush_votes_later())
+            self._vote_flush.add_done_callback(_log_task_failure)
+
+    async def _flush_votes_later(self) -> None:
+        """Flush queued votes until none are left, backing off while writes fail."""
+        delay = VOTE_FLUSH_DELAY
+        try:
+            while self._pending_votes:
+                await asyncio.sleep(delay)
+                try:
+                    await self.flush_feature_votes()
+                except Exception:
+                    delay = min(max(delay * 2, VOTE_FLUSH_RETRY_DELAY), VOTE_FLUSH_MAX_RETRY_DELAY)
+                    logger.exception("Writing feature votes failed; retrying in %.1fs", delay)
+                else:
+                    delay = VOTE_FLUSH_DELAY
+        finally:
+            self._vote_flush = None
+
+    async def flush_feature_votes(self) -> None:
+        """Apply every queued vote delta in a single UPDATE."""
+        if not self._pending_votes:
+            return
+        pending, self._pending_votes = self._pending_votes, {}
+        feature_ids = list(pending)
+        try:
+            await self._execute(
+                """
+                UPDATE feature_requests AS f
+                SET community_upvotes = GREATEST(f.community_upvotes + v.up, 0),
+                    community_downvotes = GREATEST(f.community_downvotes + v.down, 0),
+                    community_duplicate_votes = GREATEST(f.community_duplicate_votes + v.dup, 0)
+                FROM unnest($1::int[], $2::int[], $3::int[], $4::int[]) AS v(id, up, down, dup)
+                WHERE f.id = v.id
+                """,
+                (
+                    feature_ids,
+                    [pending[fid][0] for fid in feature_ids],
+                    [pending[fid][1] for fid in feature_ids],
+                    [pending[fid][2] for fid in feature_ids],
+                ),
+            )
+        except BaseException:
+            # Put the deltas back so the retry (or close()) writes them, also when cancelled.
+            for fid, deltas in pending.items():
+                queued = self._pending_votes.setdefault(fid, [0, 0, 0])
+                for index, delta in enumerate(deltas):
+                    queued[index] += delta
+            raise
+        for fid in feature_ids:
+            self._feature_cache.pop(fid)
 
     async def mark_feature_duplicate(
         self,
@@ -1223,67 +1604,80 @@ class Database:
         confidence: float,
         note: Optional[str] = None,
     ) -> None:
-        payload = {
-            "duplicate_parent": parent_id,
-            "duplicate_confidence": confidence,
-            "duplicate_note": note,
-            "duplicate_marked_at": _utcnow(),
-        }
-        await self._execute(
-            """
-            UPDATE feature_requests
-            SET status = 'duplicate',
-                duplicate_of = $1,
-                last_analyzed_at = NOW(),
-                analysis_data = COALESCE(analysis_data, '{}'::jsonb) || $2::jsonb
-            WHERE id = $3
-            """,
-            (parent_id, json.dumps(payload), request_id),
-        )
+        now = _utcnow()
         history_entry = {
-            "timestamp": _utcnow(),
+            "timestamp": now,
             "action": "marked_duplicate",
             "parent_id": parent_id,
             "confidence": confidence,
             "note": note,
         }
-        await self.append_feature_history(request_id, history_entry)
         parent_entry = {
-            "timestamp": _utcnow(),
+            "timestamp": now,
             "action": "duplicate_linked",
             "child_id": request_id,
             "confidence": confidence,
             "note": note,
         }
-        await self.append_feature_history(parent_id, parent_entry)
+        # Status change and both history appends in one statement: the child row
+        # takes the duplicate fields, the parent row only its history entry.
+        await self._execute(
+            """
+            UPDATE feature_requests
+            SET status = CASE WHEN id = $5 THEN 'duplicate' ELSE status END,
+                duplicate_of = CASE WHEN id = $5 THEN $1::int ELSE duplicate_of END,
+                last_analyzed_at = CASE WHEN id = $5 THEN NOW() ELSE last_analyzed_at END,
+                analysis_data = CASE
+                    WHEN id = $5 THEN COALESCE(analysis_data, '{}'::jsonb) || jsonb_build_object(
+                        'duplicate_parent', $1::int,
+                        'duplicate_confidence', $2::float8,
+                        'duplicate_note', $3::text,
+                        'duplicate_marked_at', $4::text
+                    )
+                    ELSE analysis_data
+                END,
+                merge_history = COALESCE(merge_history, '[]'::jsonb)
+                    || CASE WHEN id = $5 THEN $6::jsonb ELSE $7::jsonb END
+            WHERE id IN ($5, $1)
+            """,
+            (parent_id, confidence, note, now, request_id, [history_entry], [parent_entry]),
+        )
+        self._feature_cache.pop(request_id)
+        self._feature_cache.pop(parent_id)
 
-    async def append_feature_history(self, request_id: int, entry: Dict[str, Any]) -> None:
+    async def append_feature_history(
+        self, request_id: int, entry: Dict[str, Any], *, conn: Optional[asyncpg.Connection] = None
+    ) -> None:
         await self._execute(
             """
             UPDATE feature_requests
             SET merge_history = COALESCE(merge_history, '[]'::jsonb) || $1::jsonb
             WHERE id = $2
             """,
-            (json.dumps([entry]), request_id),
+            ([entry], request_id),
+            conn=conn,
         )
+        self._feature_cache.pop(request_id)
 
     async def record_feature_analysis_note(self, request_id: int, note: str, *, tag: Optional[str] = None) -> None:
+        now = _utcnow()
         payload = {
-            "timestamp": _utcnow(),
+            "timestamp": now,
             "note": note,
         }
         if tag:
             payload["tag"] = tag
-        await self.append_feature_history(request_id, {"analysis_note": payload})
         await self._execute(
             """
             UPDATE feature_requests
             SET last_analyzed_at = NOW(),
-                analysis_data = COALESCE(analysis_data, '{}'::jsonb) || $1::jsonb
-            WHERE id = $2
+                merge_history = COALESCE(merge_history, '[]'::jsonb) || $1::jsonb,
+                analysis_data = COALESCE(analysis_data, '{}'::jsonb) || jsonb_build_object($2::text, $3::text)
+            WHERE id = $4
             """,
-            (json.dumps({f"note_{_utcnow()}": note}), request_id),
+            ([{"analysis_note": payload}], f"note_{now}", note, request_id),
         )
+        self._feature_cache.pop(request_id)
 
     async def set_feature_score(
         self,
@@ -1299,49 +1693,59 @@ class Database:
         downvotes: Optional[int] = None,
         duplicate_votes: Optional[int] = None,
     ) -> None:
-        payload = {
-            "score": score,
-            "calculated_at": _utcnow(),
-            "priority_value": priority_value,
-            "ease_value": ease_value,
-        }
-        if vote_bonus is not None:
-            payload["vote_bonus"] = vote_bonus
-        if duplicate_penalty is not None:
-            payload["duplicate_penalty"] = duplicate_penalty
-        if net_votes is not None:
-            payload["net_votes"] = net_votes
-        if upvotes is not None:
-            payload["community_upvotes_snapshot"] = upvotes
-        if downvotes is not None:
-            payload["community_downvotes_snapshot"] = downvotes
-        if duplicate_votes is not None:
-            payload["community_duplicate_votes_snapshot"] = duplicate_votes
+        # Optional components are only written when given, as before.
         await self._execute(
             """
             UPDATE feature_requests
-            SET score = $1,
+            SET score = $1::float8,
                 last_analyzed_at = NOW(),
-                analysis_data = COALESCE(analysis_data, '{}'::jsonb) || $2::jsonb
-            WHERE id = $3
+                analysis_data = COALESCE(analysis_data, '{}'::jsonb)
+                    || jsonb_build_object(
+                        'score', $1::float8,
+                        'calculated_at', $2::text,
+                        'priority_value', $3::float8,
+                        'ease_value', $4::float8
+                    )
+                    || jsonb_strip_nulls(jsonb_build_object(
+                        'vote_bonus', $5::float8,
+                        'duplicate_penalty', $6::float8,
+                        'net_votes', $7::float8,
+                        'community_upvotes_snapshot', $8::float8,
+                        'community_downvotes_snapshot', $9::float8,
+                        'community_duplicate_votes_snapshot', $10::float8
+                    ))
+            WHERE id = $11
             """,
-            (score, json.dumps(payload), request_id),
+            (
+                score,
+                _utcnow(),
+                priority_value,
+                ease_value,
+                vote_bonus,
+                duplicate_penalty,
+                net_votes,
+                upvotes,
+                downvotes,
+                duplicate_votes,
+                request_id,
+            ),
         )
+        self._feature_cache.pop(request_id)
 
     async def set_similar_candidates(self, request_id: int, candidates: List[int]) -> None:
-        payload = {
-            "similar_candidates": candidates,
-            "similar_checked_at": _utcnow(),
-        }
         await self._execute(
             """
             UPDATE feature_requests
-            SET analysis_data = COALESCE(analysis_data, '{}'::jsonb) || $1::jsonb,
+            SET analysis_data = COALESCE(analysis_data, '{}'::jsonb) || jsonb_build_object(
+                    'similar_candidates', $1::int[],
+                    'similar_checked_at', $2::text
+                ),
                 last_analyzed_at = NOW()
-            WHERE id = $2
+            WHERE id = $3
             """,
-            (json.dumps(payload), request_id),
+            (list(candidates), _utcnow(), request_id),
         )
+        self._feature_cache.pop(request_id)
 
     async def mark_feature_completed(
         self,
@@ -1350,29 +1754,32 @@ class Database:
         commit_hash: Optional[str],
         commit_message: Optional[str],
     ) -> None:
-        payload = {
-            "completed_via": "git",
-            "commit_hash": commit_hash,
-            "commit_message": commit_message,
-            "completed_recorded_at": _utcnow(),
-        }
-        await self._execute(
-            """
-            UPDATE feature_requests
-            SET status = 'completed',
-                completed_at = COALESCE(completed_at, NOW()),
-                analysis_data = COALESCE(analysis_data, '{}'::jsonb) || $1::jsonb
-            WHERE id = $2
-            """,
-            (json.dumps(payload), request_id),
-        )
+        now = _utcnow()
         history_entry = {
-            "timestamp": _utcnow(),
+            "timestamp": now,
             "action": "completed",
             "commit_hash": commit_hash,
             "commit_message": commit_message,
         }
-        await self.append_feature_history(request_id, history_entry)
+        async with self._transaction() as conn:
+            await self._execute(
+                """
+                UPDATE feature_requests
+                SET status = 'completed',
+                    completed_at = COALESCE(completed_at, NOW()),
+                    analysis_data = COALESCE(analysis_data, '{}'::jsonb) || jsonb_build_object(
+                        'completed_via', 'git',
+                        'commit_hash', $1::text,
+                        'commit_message', $2::text,
+                        'completed_recorded_at', $3::text
+                    )
+                WHERE id = $4
+                """,
+                (commit_hash, commit_message, now, request_id),
+                conn=conn,
+            )
+            await self.append_feature_history(request_id, history_entry, conn=conn)
+        self._feature_cache.pop(request_id)
 
     # ========== Notification Preferences ==========
 
@@ -1393,35 +1800,11 @@ class Database:
     ) -> None:
         """Set or update user notification preferences."""
         await self.ensure_guild(guild_id)
-        existing = await self.get_user_notification_prefs(user_id, guild_id)
-        now = _utcnow()
-
-        if existing:
-            # Update existing preferences
-            if preferences:
-                assignments = []
-                params: List[Any] = []
-                for idx, (key, value) in enumerate(preferences.items(), start=1):
-                    assignments.append(f"{key} = ${idx}")
-                    params.append(value)
-                assignments.append(f"updated_at = ${len(params) + 1}")
-                params.append(now)
-                params.extend([user_id, guild_id])
-                await self._execute(
-                    f"UPDATE user_notification_preferences SET {', '.join(assignments)} WHERE user_id = ${len(params) - 1} AND guild_id = ${len(params)}",
-                    tuple(params),
-                )
-        else:
-            # Insert new preferences
-            preferences.setdefault("created_at", now)
-            preferences["updated_at"] = now
-            columns = ["user_id", "guild_id"] + list(preferences.keys())
-            placeholders = [f"${i+1}" for i in range(len(columns))]
-            values = [user_id, guild_id] + list(preferences.values())
-            await self._execute(
-                f"INSERT INTO user_notification_preferences ({', '.join(columns)}) VALUES ({', '.join(placeholders)})",
-                tuple(values),
-            )
+        await self._upsert_settings(
+            "user_notification_preferences",
+            {"user_id": user_id, "guild_id": guild_id},
+            preferences,
+        )
 
     async def get_guild_notification_defaults(self, guild_id: int) -> Optional[Dict[str, Any]]:
         """Get guild-level notification defaults."""
@@ -1436,35 +1819,35 @@ class Database:
     async def set_guild_notification_defaults(self, guild_id: int, **defaults: Any) -> None:
         """Set or update guild notification defaults."""
         await self.ensure_guild(guild_id)
-        existing = await self.get_guild_notification_defaults(guild_id)
-        now = _utcnow()
+        await self._upsert_settings("guild_notification_defaults", {"guild_id": guild_id}, defaults)
 
-        if existing:
-            # Update existing defaults
-            if defaults:
-                assignments = []
-                params: List[Any] = []
-                for idx, (key, value) in enumerate(defaults.items(), start=1):
-                    assignments.append(f"{key} = ${idx}")
-                    params.append(value)
-                assignments.append(f"updated_at = ${len(params) + 1}")
-                params.append(now)
-                params.append(guild_id)
-                await self._execute(
-                    f"UPDATE guild_notification_defaults SET {', '.join(assignments)} WHERE guild_id = ${len(params)}",
-                    tuple(params),
-                )
-        else:
-            # Insert new defaults
-            defaults.setdefault("created_at", now)
-            defaults["updated_at"] = now
-            columns = ["guild_id"] + list(defaults.keys())
-            placeholders = [f"${i+1}" for i in range(len(columns))]
-            values = [guild_id] + list(defaults.values())
-            await self._execute(
-                f"INSERT INTO guild_notification_defaults ({', '.join(columns)}) VALUES ({', '.join(placeholders)})",
-                tuple(values),
+    async def _upsert_settings(self, table: str, keys: Dict[str, Any], values: Dict[str, Any]) -> None:
+        """Insert a settings row or update the given columns of the existing one, in one statement.
+
+        ``keys`` must match the table's primary key. created_at is only set on insert.
+        """
+        key_names = tuple(keys)
+        value_names = tuple(sorted(values))
+        cache_key = (table, key_names, value_names)
+        query = self._upsert_sql.get(cache_key)
+        if query is None:
+            columns = [*key_names, *value_names, "created_at", "updated_at"]
+            placeholders = ", ".join(f"${idx}" for idx in range(1, len(columns) + 1))
+            if value_names:
+                assignments = ", ".join(f"{name} = EXCLUDED.{name}" for name in (*value_names, "updated_at"))
+                action = f"DO UPDATE SET {assignments}"
+            else:
+                action = "DO NOTHING"
+            query = (
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) "
+                f"ON CONFLICT ({', '.join(key_names)}) {action}"
             )
+            self._upsert_sql[cache_key] = query
+        now = _utcnow()
+        params = [keys[name] for name in key_names]
+        params.extend(values[name] for name in value_names)
+        params.extend((now, now))
+        await self._execute(query, tuple(params))
 
     async def record_notification(
         self,
@@ -1477,11 +1860,11 @@ class Database:
         notification_data: Optional[Dict[str, Any]] = None,
     ) -> int:
         """Record a sent notification in history."""
-        row = await self._execute(
+        new_id = await self._execute(
             """
             INSERT INTO notification_history
             (user_id, guild_id, task_id, notification_type, sent_at, delivery_method, notification_data)
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
+            VALUES ($1, $2, $3, $4, NOW(), $5, $6)
             RETURNING id
             """,
             (
@@ -1489,13 +1872,54 @@ class Database:
                 guild_id,
                 task_id,
                 notification_type,
-                _utcnow(),
                 delivery_method,
-                json.dumps(notification_data or {}),
+                notification_data or {},
             ),
-            fetchone=True,
+            fetchval=True,
+        )
+        return new_id or 0
+
+    async def record_notification_if_not_sent(
+        self,
+        user_id: int,
+        guild_id: int,
+        task_id: int,
+        notification_type: str,
+        *,
+        within_hours: int = 24,
+        delivery_method: Optional[str] = None,
+        notification_data: Optional[Dict[str, Any]] = None,
+    ) -> Optional[int]:
+        """Record a notification unless one was sent within ``within_hours``.
+
+        Returns the new history id, or None when a recent notification already exists.
+        Concurrent claims for the same (user, task, type) conflict on notification_claims;
+        the loser waits for the winner to commit, then finds its claim recent and inserts nothing.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=within_hours)
+        # The NOT EXISTS probe also honours history written by record_notification.
+        return await self._execute(
+            """
+            WITH claim AS (
+                INSERT INTO notification_claims (user_id, task_id, notification_type, claimed_at)
+                SELECT $1, $3, $4, NOW()
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM notification_history
+                    WHERE user_id = $1 AND task_id = $3 AND notification_type = $4 AND sent_at >= $7
+                )
+                ON CONFLICT (user_id, task_id, notification_type) DO UPDATE
+                SET claimed_at = EXCLUDED.claimed_at
+                WHERE notification_claims.claimed_at < $7
+                RETURNING 1
+            )
+            INSERT INTO notification_history
+            (user_id, guild_id, task_id, notification_type, sent_at, delivery_method, notification_data)
+            SELECT $1, $2, $3, $4, NOW(), $5, $6 FROM claim
+            RETURNING id
+            """,
+            (user_id, guild_id, task_id, notification_type, delivery_method, notification_data or {}, cutoff),
+            fetchval=True,
         )
-        return row["id"] if row else 0
 
     async def check_notification_sent(
         self,
@@ -1506,31 +1930,33 @@ class Database:
         within_hours: int = 24,
     ) -> bool:
         """Check if a notification was recently sent to avoid duplicates."""
-        from datetime import datetime, timedelta, timezone
-        cutoff = (datetime.now(timezone.utc) - timedelta(hours=within_hours)).strftime(ISO_FORMAT)
+        # sent_at is TIMESTAMPTZ, so the cutoff binds as a datetime without formatting
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=within_hours)
 
         # Handle NULL task_id for digests - use IS NOT DISTINCT FROM for proper NULL comparison
         if task_id is None:
-            row = await self._execute(
+            sent = await self._execute(
                 """
-                SELECT COUNT(1) as count
-                FROM notification_history
-                WHERE user_id = $1 AND task_id IS NULL AND notification_type = $2 AND sent_at >= $3
+                SELECT EXISTS (
+                    SELECT 1 FROM notification_history
+                    WHERE user_id = $1 AND task_id IS NULL AND notification_type = $2 AND sent_at >= $3
+                ) AS sent
                 """,
                 (user_id, notification_type, cutoff),
-                fetchone=True,
+                fetchval=True,
             )
         else:
-            row = await self._execute(
+            sent = await self._execute(
                 """
-                SELECT COUNT(1) as count
-                FROM notification_history
-                WHERE user_id = $1 AND task_id = $2 AND notification_type = $3 AND sent_at >= $4
+                SELECT EXISTS (
+                    SELECT 1 FROM notification_history
+                    WHERE user_id = $1 AND task_id = $2 AND notification_type = $3 AND sent_at >= $4
+                ) AS sent
                 """,
                 (user_id, task_id, notification_type, cutoff),
-                fetchone=True,
+                fetchval=True,
             )
-        return bool(row and row["count"] > 0)
+        return bool(sent)
 
     async def check_channel_digest_sent(
         self,
@@ -1551,24 +1977,23 @@ class Database:
         Returns:
             True if digest was sent recently, False otherwise
         """
-        from datetime import datetime, timedelta, timezone
-        import json
-        cutoff = (datetime.now(timezone.utc) - timedelta(hours=within_hours)).strftime(ISO_FORMAT)
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=within_hours)
         
-        row = await self._execute(
+        sent = await self._execute(
             """
-            SELECT COUNT(1) as count
-            FROM notification_history
-            WHERE guild_id = $1 
-              AND notification_type = $2 
-              AND task_id IS NULL
-              AND notification_data->>'channel_id' = $3
-              AND sent_at >= $4
+            SELECT EXISTS (
+                SELECT 1 FROM notification_history
+                WHERE guild_id = $1
+                  AND notification_type = $2
+                  AND task_id IS NULL
+                  AND notification_data->>'channel_id' = $3
+                  AND sent_at >= $4
+            ) AS sent
             """,
             (guild_id, notification_type, str(channel_id), cutoff),
-            fetchone=True,
+            fetchval=True,
         )
-        return bool(row and row["count"] > 0)
+        return bool(sent)
 
     async def record_channel_digest(
         self,
@@ -1586,15 +2011,14 @@ class Database:
         Returns:
             Notification history record ID
         """
-        import json
         notification_data = {"channel_id": channel_id}
         
         # Use user_id=0 as sentinel for channel-level digests (not user-specific)
-        row = await self._execute(
+        new_id = await self._execute(
             """
             INSERT INTO notification_history
             (user_id, guild_id, task_id, notification_type, sent_at, delivery_method, notification_data)
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
+            VALUES ($1, $2, $3, $4, NOW(), $5, $6)
             RETURNING id
             """,
             (
@@ -1602,13 +2026,12 @@ class Database:
                 guild_id,
                 None,  # task_id is NULL for digests
                 notification_type,
-                _utcnow(),
                 "channel",  # Channel digests are always sent to channels
-                json.dumps(notification_data),
+                notification_data,
             ),
-            fetchone=True,
+            fetchval=True,
         )
-        return row["id"] if row else 0
+        return new_id or 0
 
     async def acknowledge_notification(self, notification_id: int) -> bool:
         """Mark a notification as acknowledged/read."""
@@ -1619,28 +2042,55 @@ class Database:
         )
         return bool(result)
 
+    async def delete_notification(self, notification_id: int) -> bool:
+        """Remove a history record, e.g. one claimed for a send that then failed."""
+        # Also release the claim taken alongside it (same statement, so same NOW()).
+        deleted = await self._execute(
+            """
+            WITH gone AS (
+                DELETE FROM notification_history WHERE id = $1
+                RETURNING user_id, task_id, notification_type, sent_at
+            ), released AS (
+                DELETE FROM notification_claims c
+                USING gone
+                WHERE c.user_id = gone.user_id
+                  AND c.task_id = gone.task_id
+                  AND c.notification_type = gone.notification_type
+                  AND c.claimed_at = gone.sent_at
+            )
+            SELECT COUNT(1) FROM gone
+            """,
+            (notification_id,),
+            fetchval=True,
+        )
+        return bool(deleted)
+
     async def snooze_reminder(
         self,
         user_id: int,
         task_id: int,
         notification_type: str,
-        snooze_until: str,
+        snooze_until: Union[datetime, str],
     ) -> int:
         """Snooze a reminder until a specific time."""
-        row = await self._execute(
+        snooze_until = to_datetime(snooze_until)
+        new_id = await self._execute(
             """
             INSERT INTO snoozed_reminders
             (user_id, task_id, notification_type, snoozed_at, snooze_until, created_at)
-            VALUES ($1, $2, $3, $4, $5, $6)
+            VALUES ($1, $2, $3, $4, $5, $4)
             RETURNING id
             """,
-            (user_id, task_id, notification_type, _utcnow(), snooze_until, _utcnow()),
-            fetchone=True,
+            (user_id, task_id, notification_type, _utcnow(), snooze_until),
+            fetchval=True,
         )
-        return row["id"] if row else 0
+        return new_id or 0
 
-    async def get_due_snoozed_reminders(self) -> List[Dict[str, Any]]:
-        """Get snoozed reminders that are now due."""
+    async def get_due_snoozed_reminders(self, *, limit: int = 500) -> List[asyncpg.Record]:
+        """Get up to ``limit`` snoozed reminders that are now due, oldest first.
+
+        Processed reminders are deleted, so anything past the limit is picked up next tick.
+        """
         rows = await self._execute(
             """
             SELECT
@@ -1659,13 +2109,14 @@ class Database:
             FROM snoozed_reminders sr
             JOIN tasks t ON sr.task_id = t.id
             JOIN boards ON t.board_id = boards.id AND (boards.deleted_at IS NULL)
-            WHERE sr.snooze_until <= $1
+            WHERE sr.snooze_until <= NOW()
             ORDER BY sr.snooze_until ASC
+            LIMIT $1
             """,
-            (_utcnow(),),
+            (limit,),
             fetchall=True,
         )
-        return [dict(row) for row in rows or []]
+        return rows or []
 
     async def delete_snoozed_reminder(self, snooze_id: int) -> bool:
         """Delete a snoozed reminder after processing."""
@@ -1688,11 +2139,11 @@ class Database:
     ) -> int:
         """Create a custom reminder rule."""
         await self.ensure_guild(guild_id)
-        row = await self._execute(
+        new_id = await self._execute(
             """
             INSERT INTO custom_reminder_rules
             (user_id, guild_id, board_id, rule_name, rule_pattern, rule_data, created_at, updated_at)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $7)
             RETURNING id
             """,
             (
@@ -1701,19 +2152,18 @@ class Database:
                 board_id,
                 rule_name,
                 rule_pattern,
-                json.dumps(rule_data),
-                _utcnow(),
+                rule_data,
                 _utcnow(),
             ),
-            fetchone=True,
+            fetchval=True,
         )
-        return row["id"] if row else 0
+        return new_id or 0
 
     async def get_custom_reminder_rules(
         self,
         user_id: int,
         guild_id: int,
-    ) -> List[Dict[str, Any]]:
+    ) -> List[asyncpg.Record]:
         """Get all custom reminder rules for a user in a guild."""
         rows = await self._execute(
             """
@@ -1724,7 +2174,16 @@ class Database:
             (user_id, guild_id),
             fetchall=True,
         )
-        return [dict(row) for row in rows or []]
+        return rows or []
+
+    @asynccontextmanager
+    async def _transaction(self) -> AsyncIterator[asyncpg.Connection]:
+        """Yield a pooled connection inside a transaction; pass it to _execute via conn=."""
+        if self._pool is None:
+            raise RuntimeError("Database not initialized. Call init() first.")
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                yield conn
 
     async def _execute(
         self,
@@ -1733,17 +2192,38 @@ class Database:
         *,
         fetchone: bool = False,
         fetchall: bool = False,
+        fetchval: bool = False,
         rowcount: bool = False,
+        conn: Optional[asyncpg.Connection] = None,
     ) -> Any:
+        # Pool.fetchrow/fetch/execute acquire and release internally, so the
+        # common no-conn path needs no acquire() context of its own.
+        return await self._run(self._target(conn), query, tuple(params), fetchone, fetchall, fetchval, rowcount)
+
+    def _target(self, conn: Optional[asyncpg.Connection]) -> Union[asyncpg.Connection, asyncpg.Pool]:
+        if conn is not None:
+            return conn
         if self._pool is None:
             raise RuntimeError("Database not initialized. Call init() first.")
-        params_seq: Sequence[Any] = tuple(params)
-        async with self._pool.acquire() as conn:
-            if fetchone:
-                return await conn.fetchrow(query, *params_seq)
-            if fetchall:
-                return await conn.fetch(query, *params_seq)
-            status = await conn.execute(query, *params_seq)
-            if rowcount:
-                return _parse_command_tag(status)
-            return status
+        return self._pool
+
+    @staticmethod
+    async def _run(
+        conn: Union[asyncpg.Connection, asyncpg.Pool],
+        query: str,
+        params_seq: Sequence[Any],
+        fetchone: bool,
+        fetchall: bool,
+        fetchval: bool,
+        rowcount: bool,
+    ) -> Any:
+        if fetchone:
+            return await conn.fetchrow(query, *params_seq)
+        if fetchall:
+            return await conn.fetch(query, *params_seq)
+        if fetchval:
+            return await conn.fetchval(query, *params_seq)
+        status = await conn.execute(query, *params_seq)
+        if rowcount:
+            return _parse_command_tag(status)
+        return status
@@ -1,31 +1,35 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 import discord
 
+from .db import to_datetime
+
 DATE_FORMAT = "%b %d, %Y %H:%M UTC"
 FOOTER_TEXT = "distask.xyz"
 DEFAULT_COLOR = discord.Color.from_rgb(118, 75, 162)
 
 
-def _format_time(value: Optional[str]) -> str:
+# Due dates repeat across tasks (shared deadlines), so parsed results are memoised.
+@lru_cache(maxsize=2048)
+def _format_time(value: Optional[Union[datetime, str]]) -> str:
     if not value:
         return "—"
     try:
-        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
-        return dt.strftime(DATE_FORMAT)
+        return to_datetime(value).strftime(DATE_FORMAT)
     except ValueError:
         return value
 
 
-def _format_relative_time(iso_timestamp: Optional[str]) -> str:
+def _format_relative_time(iso_timestamp: Optional[Union[datetime, str]]) -> str:
     """Format timestamp as relative time (e.g., '3 days ago' or 'in 3 days')."""
     if not iso_timestamp:
         return "Unknown"
     try:
-        dt = datetime.fromisoformat(iso_timestamp.replace("Z", "+00:00"))
+        dt = to_datetime(iso_timestamp)
         now = datetime.now(timezone.utc)
         delta = now - dt
         abs_delta = abs(delta)
@@ -133,7 +137,7 @@ def _calculate_task_status_color(task: Dict[str, Any]) -> discord.Color:
         return discord.Color.from_rgb(118, 75, 162)  # Default blue-purple
     
     try:
-        dt = datetime.fromisoformat(due_date.replace("Z", "+00:00"))
+        dt = to_datetime(due_date)
         now = datetime.now(timezone.utc)
         delta = dt - now
         
@@ -517,7 +521,7 @@ class EmbedFactory:
             relative_time = _format_relative_time(due_date)
             # Check if overdue
             try:
-                dt = datetime.fromisoformat(due_date.replace("Z", "+00:00"))
+                dt = to_datetime(due_date)
                 now = datetime.now(timezone.utc)
                 is_overdue = dt < now and not task.get("completed")
                 due_emoji = "🔴" if is_overdue else "📅"
@@ -563,6 +567,7 @@ class EmbedFactory:
             color=self.color,
         )
         
+        now = datetime.now(timezone.utc)
         for task in tasks[:10]:  # Limit to 10 results to avoid embed limits
             # Determine status indicators
             completed = task.get("completed", False)
@@ -589,8 +594,7 @@ class EmbedFactory:
                 relative_time = _format_relative_time(due_date)
                 # Check if overdue
                 try:
-                    dt = datetime.fromisoformat(due_date.replace("Z", "+00:00"))
-                    now = datetime.now(timezone.utc)
+                    dt = to_datetime(due_date)
                     is_overdue = dt < now and not completed
                     due_emoji = "🔴" if is_overdue else "📅"
                     value_parts.append(f"{due_emoji} **Due:** {formatted_time} ({relative_time})")
@@ -632,7 +636,7 @@ class EmbedFactory:
                 continue
             
             try:
-                dt = datetime.fromisoformat(due_date.replace("Z", "+00:00"))
+                dt = to_datetime(due_date)
                 delta = dt - now
                 
                 if delta.days < 0:
@@ -9,12 +9,12 @@ This module provides:
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta, timezone
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import discord
 
-from utils.db import Database
+from utils.db import Database, to_datetime
 from utils.preference_manager import PreferenceManager
 
 if TYPE_CHECKING:
@@ -46,6 +46,7 @@ class NotificationRouter:
         task_id: Optional[int] = None,
         channel_id: Optional[int] = None,
         view: Optional[discord.ui.View] = None,
+        within_hours: int = 24,
     ) -> bool:
         """Send a notification to a user based on their preferences.
 
@@ -57,6 +58,7 @@ class NotificationRouter:
             task_id: Optional task ID associated with notification
             channel_id: Channel ID for channel-based notifications
             view: Optional view with interactive buttons
+            within_hours: Suppress the send if the same task notification went out this recently
 
         Returns:
             True if notification was sent successfully, False otherwise
@@ -71,34 +73,38 @@ class NotificationRouter:
             logger.debug(f"User {user_id} is in quiet hours, skipping notification")
             return False
 
-        # Check for duplicate notifications
-        if task_id and await self.db.check_notification_sent(
-            user_id, task_id, notification_type, within_hours=24
-        ):
-            logger.debug(f"Duplicate notification suppressed for user {user_id}, task {task_id}")
-            return False
-
         # Get preferred delivery method
         delivery_method = await self.pref_manager.get_preferred_delivery_method(user_id, guild_id)
 
-        # Attempt delivery
-        success = False
-        if delivery_method == "dm":
-            success = await self._send_dm(user_id, embed, view)
-        elif delivery_method == "channel_mention":
-            success = await self._send_channel_mention(user_id, guild_id, channel_id, embed, view)
-        else:  # channel
-            success = await self._send_channel(guild_id, channel_id, embed, view)
-
-        # Record notification in history if successful
-        if success and task_id:
-            await self.db.record_notification(
-                user_id=user_id,
-                guild_id=guild_id,
-                notification_type=notification_type,
-                task_id=task_id,
+        # Claim the history slot up front so concurrent senders cannot both deliver;
+        # the claim is released whenever delivery does not succeed.
+        notification_id: Optional[int] = None
+        if task_id:
+            notification_id = await self.db.record_notification_if_not_sent(
+                user_id,
+                guild_id,
+                task_id,
+                notification_type,
+                within_hours=within_hours,
                 delivery_method=delivery_method,
             )
+            if notification_id is None:
+                logger.debug(f"Duplicate notification suppressed for user {user_id}, task {task_id}")
+                return False
+
+        # Attempt delivery
+        success = False
+        try:
+            if delivery_method == "dm":
+                success = await self._send_dm(user_id, embed, view)
+            elif delivery_method == "channel_mention":
+                success = await self._send_channel_mention(user_id, guild_id, channel_id, embed, view)
+            else:  # channel
+                success = await self._send_channel(guild_id, channel_id, embed, view)
+        finally:
+            # Also covers errors and cancellation escaping the _send_* helpers
+            if not success and notification_id is not None:
+                await self.db.delete_notification(notification_id)
 
         return success
 
@@ -251,7 +257,7 @@ class EventNotifier:
                 embed.add_field(name="Description", value=desc, inline=False)
 
             if task.get("due_date"):
-                embed.add_field(name="Due Date", value=f"<t:{int(datetime.fromisoformat(task['due_date'].replace('Z', '+00:00')).timestamp())}:R>", inline=True)
+                embed.add_field(name="Due Date", value=f"<t:{int(to_datetime(task['due_date']).timestamp())}:R>", inline=True)
 
             embed.add_field(name="Assigned By", value=f"<@{assigner_id}>", inline=True)
 
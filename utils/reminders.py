@@ -8,7 +8,7 @@ from typing import Any, Dict, List
 import discord
 
 from .embeds import EmbedFactory
-from .db import Database, ISO_FORMAT
+from .db import Database
 
 
 class ReminderScheduler:
@@ -74,8 +74,7 @@ class ReminderScheduler:
         async with self._tick_lock:
             now = datetime.now(timezone.utc)
             guilds = await self.db.list_guilds()
-            horizon = (now + timedelta(days=1)).strftime(ISO_FORMAT)
-            due_tasks = await self.db.fetch_due_tasks(horizon)
+            due_tasks = await self.db.fetch_due_tasks(now + timedelta(days=1))
             for guild in guilds:
                 if not guild.get("notify_enabled"):
                     continue
@@ -17,7 +17,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 import discord
 import pytz
 
-from utils.db import Database, ISO_FORMAT
+from utils.db import Database, to_datetime
 from utils.notifications import NotificationRouter
 from utils.preference_manager import PreferenceManager
 
@@ -50,15 +50,14 @@ class DueDateReminderEngine:
         now = datetime.now(timezone.utc)
 
         # Check tasks due in the next 7 days
-        future_window = (now + timedelta(days=7)).strftime(ISO_FORMAT)
-        tasks = await self.db.fetch_due_tasks(future_window)
+        tasks = await self.db.fetch_due_tasks(now + timedelta(days=7))
 
         for task in tasks:
             assignee_ids = task.get("assignee_ids", [])
             if not assignee_ids:
                 continue
 
-            task_due_date = datetime.fromisoformat(task["due_date"].replace("Z", "+00:00"))
+            task_due_date = to_datetime(task["due_date"])
             time_until_due = task_due_date - now
 
             for assignee_id in assignee_ids:
@@ -86,15 +85,6 @@ class DueDateReminderEngine:
                     continue
 
                 if should_remind:
-                    # Check if we already sent this reminder
-                    if await self.db.check_notification_sent(
-                        assignee_id,
-                        task["id"],
-                        "due_date",
-                        within_hours=12,
-                    ):
-                        continue
-
                     # Create reminder embed
                     embed = discord.Embed(
                         title="🔔 Task Due Soon",
@@ -138,6 +128,7 @@ class DueDateReminderEngine:
                         task_id=task["id"],
                         channel_id=task.get("channel_id"),
                         view=view,
+                        within_hours=12,
                     )
 
 
@@ -176,8 +167,11 @@ class DigestEngine:
             # Group tasks by channel_id (one digest per channel)
             channel_tasks_map: Dict[int, List[Dict[str, Any]]] = {}
 
+            tasks_by_board = await self.db.fetch_tasks_for_boards(
+                [board["id"] for board in boards], include_completed=False
+            )
             for board in boards:
-                tasks = await self.db.fetch_tasks(board["id"], include_completed=False)
+                tasks = tasks_by_board[board["id"]]
                 channel_id = board["channel_id"]
 
                 if channel_id not in channel_tasks_map:
@@ -370,7 +364,7 @@ class DigestEngine:
                 other.append(task)
                 continue
 
-            due_date = datetime.fromisoformat(task["due_date"].replace("Z", "+00:00"))
+            due_date = to_datetime(task["due_date"])
             days_until = (due_date - now).days
 
             if due_date < now:
@@ -577,7 +571,7 @@ class DigestEngine:
             due_soon_count = 0
             for t in board_task_list:
                 if t.get("due_date"):
-                    due_date = datetime.fromisoformat(t["due_date"].replace("Z", "+00:00"))
+                    due_date = to_datetime(t["due_date"])
                     days_until = (due_date - now).days
                     if due_date < now:
                         overdue_count += 1
@@ -647,17 +641,16 @@ class EscalationEngine:
         logger.debug("EscalationEngine: Checking for overdue tasks")
 
         now = datetime.now(timezone.utc)
-        now_str = now.strftime(ISO_FORMAT)
 
         # Get all overdue tasks
-        tasks = await self.db.fetch_due_tasks(now_str)
+        tasks = await self.db.fetch_due_tasks(now)
 
         for task in tasks:
             assignee_ids = task.get("assignee_ids", [])
             if not assignee_ids:
                 continue
 
-            due_date = datetime.fromisoformat(task["due_date"].replace("Z", "+00:00"))
+            due_date = to_datetime(task["due_date"])
             days_overdue = (now - due_date).days
             hours_overdue = (now - due_date).total_seconds() / 3600
 
@@ -671,16 +664,7 @@ class EscalationEngine:
             elif days_overdue >= 1:
                 reminder_interval_hours = 6   # Every 6 hours
 
-            # Only send if enough time has passed since last reminder
             for assignee_id in assignee_ids:
-                if await self.db.check_notification_sent(
-                    assignee_id,
-                    task["id"],
-                    "escalation",
-                    within_hours=int(reminder_interval_hours),
-                ):
-                    continue
-
                 # Create escalation embed
                 urgency_color = discord.Color.dark_red() if days_overdue >= 7 else discord.Color.red()
 
@@ -721,6 +705,8 @@ class EscalationEngine:
                     task_id=task["id"],
                     channel_id=task.get("channel_id"),
                     view=view,
+                    # Only sent if enough time has passed since the last reminder
+                    within_hours=reminder_interval_hours,
                 )
 
 
@@ -768,7 +754,7 @@ class SnoozedReminderEngine:
             )
 
             if task.get("due_date"):
-                due_date = datetime.fromisoformat(task["due_date"].replace("Z", "+00:00"))
+                due_date = to_datetime(task["due_date"])
                 embed.add_field(
                     name="Due Date",
                     value=f"<t:{int(due_date.timestamp())}:R>",